@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""Benchmark generate-oja-docs.py — the guide plus synthetic scaling workloads
+
+Run:  python3 bench-docs.py                      # compare to the baseline
+      python3 bench-docs.py --save-baseline      # record a new baseline
+      python3 bench-docs.py --profile docs.prof  # + cProfile of the slowest docx case
+Out:  bench-docs-report.json (exit 1 on any regression)
+"""
+
+import argparse
+import contextlib
+import cProfile
+import importlib.util
+import io
+import json
+import os
+import platform
+import pstats
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from docx import Document
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.shared import Inches, Pt
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(HERE, 'bench-docs-baseline.json')
+REPORT = 'bench-docs-report.json'
+
+TABLE_ROWS = [10, 100, 1000, 10000, 50000]
+SECTION_COUNTS = [100, 500]
+CODE_LINES = [1000, 10000]
+QUICK = {'rows': [10, 1000, 10000], 'sections': [100], 'code': [1000]}
+FORMATS = ['docx', 'md', 'html', 'index']
+
+# The per-cell reference grows superlinearly; past this it only proves the point slowly
+REFERENCE_MAX_ROWS = 1000
+MAX_SECONDS_10K = 5.0
+
+# A regression has to clear the relative threshold and this absolute floor
+# (python-docx builds jitter by tens of ms on a busy machine)
+MIN_SECONDS = 0.05
+MIN_BYTES = 256 * 1024
+
+CATALOG_HEADERS = ['SKU', 'Product', 'Category', 'Price (₦)', 'Stock']
+CATALOG_WIDTHS = [1.0, 2.5, 1.3, 1.0, 0.7]
+CATEGORIES = ['Beverages', 'Provisions', 'Toiletries', 'Electronics', 'Frozen']
+
+
+def load_docs():
+    spec = importlib.util.spec_from_file_location('generate_oja_docs', os.path.join(HERE, 'generate-oja-docs.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def catalog_rows(n):
+    """A synthetic product catalog / price list"""
+    return [[f'OJA-{i:06d}', f'Product {i} — {CATEGORIES[i % 5].lower()} & co <{i % 97}>',
+             CATEGORIES[i % 5], f'{(i * 137) % 250000 / 100:,.2f}', str(i % 400)]
+            for i in range(n)]
+
+
+def table_sections(docs, rows):
+    title = f'1. Catalog ({rows:,} products)'
+    return [docs.Section(title, [docs.Heading(1, title),
+                                 docs.DataTable(CATALOG_HEADERS, catalog_rows(rows), CATALOG_WIDTHS)])]
+
+
+def many_sections(docs, count):
+    """count guide-shaped sections: headings, prose, steps, a small table, a snippet"""
+    sections = []
+    for i in range(1, count + 1):
+        title = f'{i}. Section {i}'
+        sections.append(docs.Section(title, [
+            docs.Heading(1, title),
+            docs.Paragraph(f'Section {i} explains one part of the setup in a couple of sentences. '
+                           'It is about as long as a typical paragraph in the guide.'),
+            docs.Heading(2, 'Steps'),
+            *[docs.ListItem(f'Step {j} of section {i}', ordered=True) for j in range(1, 6)],
+            docs.DataTable(['Property', 'Value'], [[f'Key {j}', f'Value {i}.{j}'] for j in range(8)], [2.0, 4.5]),
+            docs.Spacer(),
+            docs.Paragraph('Check the result before moving on.', 'note', 'Note: '),
+            docs.Code(f'npx expo export --platform web  # section {i}'),
+        ]))
+    return sections
+
+
+def code_sections(docs, lines):
+    title = f'1. Listing ({lines:,} lines)'
+    code = '\n'.join(f'    const line{i} = await supabase.from("sales").select("*").eq("id", {i});'
+                     for i in range(lines))
+    return [docs.Section(title, [docs.Heading(1, title), docs.Code(code)])]
+
+
+def reference_add_table(doc, headers, rows, col_widths=None):
+    """The original python-docx per-cell add_table, kept as the baseline to beat"""
+    t = doc.add_table(rows=1 + len(rows), cols=len(headers))
+    t.alignment = WD_TABLE_ALIGNMENT.LEFT
+    t.style = 'Table Grid'
+    for i, h in enumerate(headers):
+        cell = t.rows[0].cells[i]
+        cell.text = h
+        for p in cell.paragraphs:
+            for r in p.runs:
+                r.bold = True
+                r.font.size = Pt(10)
+    for ri, row in enumerate(rows):
+        for ci, val in enumerate(row):
+            t.rows[ri + 1].cells[ci].text = val
+            for p in t.rows[ri + 1].cells[ci].paragraphs:
+                for r in p.runs:
+                    r.font.size = Pt(10)
+    if col_widths:
+        for ri_idx in range(len(t.rows)):
+            for ci_idx, w in enumerate(col_widths):
+                t.rows[ri_idx].cells[ci_idx].width = Inches(w)
+    doc.add_paragraph()
+    return t
+
+
+def reference_table(rows):
+    doc = Document()
+    reference_add_table(doc, CATALOG_HEADERS, rows, col_widths=CATALOG_WIDTHS)
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
+
+
+def cases(docs, tmp, sizes, reference=False):
+    """(name, fn) for the real guide and every synthetic workload x format.
+
+    fn returns the output bytes (or their size). Every case except
+    guide-warm starts from empty caches, so the numbers are cold builds.
+    """
+    def cold():
+        shutil.rmtree(os.path.join(tmp, 'cache'), ignore_errors=True)
+
+    def render(fmt, sections):
+        cold()
+        return docs.RENDERERS[fmt][0](sections)
+
+    def guide(warm):
+        if not warm:
+            cold()
+        outputs = docs.build(out_dir=os.path.join(tmp, 'out'), jobs=1)
+        return sum(os.path.getsize(p) for p in outputs.values())
+
+    # Keep the repo's own caches out of it
+    docs.SOURCE_CACHE = os.path.join(tmp, 'cache', 'sources.json')
+    docs.DOCX_FRAGMENTS = os.path.join(tmp, 'cache', 'docx')
+    docs.THUMBNAILS = os.path.join(tmp, 'cache', 'thumbs')
+    docs.INDEX_FRAGMENTS = os.path.join(tmp, 'cache', 'index')
+
+    found = [('guide', lambda: guide(False)), ('guide-warm', lambda: guide(True))]
+    workloads = ([(f'table@{n}', table_sections, n) for n in sizes['rows']]
+                 + [(f'sections@{n}', many_sections, n) for n in sizes['sections']]
+                 + [(f'code@{n}', code_sections, n) for n in sizes['code']])
+    for name, make, n in workloads:
+        sections = make(docs, n)
+        for fmt in FORMATS:
+            found.append((f'{name}/{fmt}', lambda fmt=fmt, sections=sections: render(fmt, sections)))
+        if reference and make is table_sections and n <= REFERENCE_MAX_ROWS:
+            rows = sections[0].nodes[1].rows
+            found.append((f'{name}/per-cell', lambda rows=rows: reference_table(rows)))
+    return found
+
+
+def measure(fn, repeat):
+    """Best-of-repeat wall time, then one traced run for the Python heap peak.
+
+    The generator is pure Python, so tracemalloc's overhead would swamp the
+    timings; memory gets its own run.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            out = fn()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    heap_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'seconds': round(best, 5),
+        'tracemalloc_peak': heap_peak,
+        'output_bytes': out if isinstance(out, int) else len(out),
+    }
+
+
+def profile(fn, path, top=15):
+    """cProfile one call, dump the stats to path and print the hot spots"""
+    profiler = cProfile.Profile()
+    with contextlib.redirect_stdout(io.StringIO()):
+        profiler.runcall(fn)
+    profiler.dump_stats(path)
+    print(f'\n🔥 Top {top} by cumulative time (full stats in {path}):')
+    pstats.Stats(profiler).sort_stats('cumulative').print_stats(top)
+
+
+def run(sizes, repeat, reference=False, profile_path=None):
+    docs = load_docs()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        all_cases = cases(docs, tmp, sizes, reference)
+        # Warm-up: first-call costs (template load, lxml parser setup) are not the generator's
+        with contextlib.redirect_stdout(io.StringIO()):
+            all_cases[0][1]()
+        for name, fn in all_cases:
+            results[name] = r = measure(fn, repeat)
+            print(f'  {name:<24} {r["seconds"] * 1000:9.1f} ms  '
+                  f'heap {r["tracemalloc_peak"] / 1024:8.0f} KB  '
+                  f'out {r["output_bytes"] / 1024:7.0f} KB')
+        if profile_path:
+            name, fn = max((c for c in all_cases if c[0].endswith('/docx')),
+                           key=lambda c: results[c[0]]['seconds'])
+            print(f'\nProfiling {name}...')
+            profile(fn, profile_path)
+    import docx
+    import lxml
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'python-docx': getattr(docx, '__version__', '?'),
+            'lxml': lxml.__version__,
+            'machine': platform.machine(),
+            'system': platform.system(),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(report, baseline, time_threshold, memory_threshold):
+    """List of human-readable regressions against the baseline report"""
+    regressions = []
+    for name, cur in report['results'].items():
+        if name.startswith('table@') and name.endswith('/docx'):
+            rows = int(name[len('table@'):-len('/docx')])
+            if rows >= 10000 and cur['seconds'] > MAX_SECONDS_10K * rows / 10000:
+                regressions.append(f'{name}: {cur["seconds"]:.2f}s, over {MAX_SECONDS_10K:.0f}s '
+                                   'per 10,000 rows')
+    for name, base in baseline['results'].items():
+        cur = report['results'].get(name)
+        if cur is None:
+            continue
+        if (cur['seconds'] > base['seconds'] * (1 + time_threshold)
+                and cur['seconds'] - base['seconds'] > MIN_SECONDS):
+            regressions.append(f'{name}: {base["seconds"] * 1000:.1f} → {cur["seconds"] * 1000:.1f} ms')
+        for key in ('tracemalloc_peak', 'output_bytes'):
+            if (cur[key] > base[key] * (1 + memory_threshold)
+                    and cur[key] - base[key] > MIN_BYTES):
+                regressions.append(f'{name}: {key} {base[key]:,} → {cur[key]:,} bytes')
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark generate-oja-docs.py')
+    parser.add_argument('--rows', type=int, nargs='+', help='table sizes to sweep (default: 10-50000)')
+    parser.add_argument('--quick', action='store_true', help='smaller sweep, no 50,000-row table')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per case, best time kept (default: 3)')
+    parser.add_argument('--reference', action='store_true',
+                        help=f'also time the original per-cell table builder (up to {REFERENCE_MAX_ROWS} rows)')
+    parser.add_argument('--profile', metavar='PATH', help='cProfile the slowest docx case into PATH')
+    parser.add_argument('--out', default=REPORT, help=f'report path (default: {REPORT})')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline report to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='write this run as the new baseline')
+    parser.add_argument('--time-threshold', type=float, default=0.25,
+                        help='allowed relative slowdown before failing (default: 0.25)')
+    parser.add_argument('--memory-threshold', type=float, default=0.10,
+                        help='allowed relative heap/output growth before failing (default: 0.10)')
+    args = parser.parse_args(argv)
+
+    sizes = dict(QUICK) if args.quick else {'rows': TABLE_ROWS, 'sections': SECTION_COUNTS, 'code': CODE_LINES}
+    if args.rows:
+        sizes['rows'] = args.rows
+    print(f'⏱  Benchmarking generate-oja-docs.py ({args.repeat} runs per case)...\n')
+    report = run(sizes, args.repeat, args.reference, args.profile)
+
+    out = args.baseline if args.save_baseline else args.out
+    with open(out, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write('\n')
+    print(f'\n✅ Wrote {out}')
+    if args.save_baseline:
+        return
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f'⚠️  No baseline at {args.baseline} — run with --save-baseline first')
+        return
+    regressions = compare(report, baseline, args.time_threshold, args.memory_threshold)
+    for line in regressions:
+        print(f'❌ {line}')
+    if regressions:
+        raise SystemExit(1)
+    print(f'✅ No regressions against {os.path.basename(args.baseline)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Benchmark generate-icons.py — wall time and memory per generator and size
+
+Run:  python3 bench-icons.py                      # compare to the baseline
+      python3 bench-icons.py --save-baseline      # record a new baseline
+Out:  bench-icons-report.json (exit 1 on any regression)
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(HERE, 'bench-icons-baseline.json')
+REPORT = 'bench-icons-report.json'
+
+ICON_SIZES = [16, 32, 48, 64, 128, 180, 192, 256, 512, 1024, 2048, 4096]
+QUICK_SIZES = [16, 48, 192, 1024]
+
+# A regression has to clear the relative threshold and this absolute floor,
+# so sub-millisecond noise on tiny icons never fails the run
+MIN_SECONDS = 0.002
+MIN_BYTES = 64 * 1024
+
+# The sdf engine has to match PIL (8x supersampled) at least this closely.
+# Below SDF_MIN_SIZE PIL's own integer stroke widths dominate the difference.
+SDF_MIN_PSNR = 35.0
+SDF_MIN_SIZE = 48
+SDF_MATTE = (128, 128, 128, 255)    # backdrop for comparing transparent designs
+
+
+def load_generator():
+    spec = importlib.util.spec_from_file_location('generate_icons', os.path.join(HERE, 'generate-icons.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # The generator imports PIL and numpy on first use; load them here so the
+    # first case measured doesn't pay for the import
+    importlib.import_module('PIL.Image')
+    if module.have_numpy():
+        importlib.import_module('numpy')
+    return module
+
+
+def cases(gi, sizes, quick=False):
+    """Yield (name, callable(path)) for every generator x size in the sweep"""
+    for size in sizes:
+        yield f'icon@{size}', lambda path, s=size: gi.generate_icon(s, path)
+        yield f'adaptive-icon@{size}', lambda path, s=size: gi.generate_adaptive_icon(s, path)
+        yield f'favicon@{size}', lambda path, s=size: gi.generate_favicon(s, path)
+        if gi.have_numpy():
+            yield f'icon-sdf@{size}', lambda path, s=size: gi.save(gi.render_emblem_sdf('icon', s), path)
+    devices = gi.SPLASH_DEVICES[::4] if quick else gi.SPLASH_DEVICES
+    for _, w, h in devices:
+        yield f'splash@{w}x{h}', lambda path, w=w, h=h: gi.generate_splash(w, h, path)
+
+
+def measure(gi, fn, path, repeat):
+    """Best-of-repeat wall time plus peak Python heap and peak raster bytes.
+
+    Caches are cleared before every run so each number is a cold render.
+    Pillow's pixel buffers live outside the Python allocator, so tracemalloc
+    only sees the Python side; raster_peak comes from the renderer itself.
+    """
+    best = None
+    heap_peak = raster_peak = 0
+    for _ in range(repeat):
+        gi.clear_caches()
+        gi.render_stats['peak_bytes'] = 0
+        tracemalloc.start()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn(path)
+        seconds = time.perf_counter() - start
+        heap_peak = max(heap_peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        raster_peak = max(raster_peak, gi.render_stats['peak_bytes'])
+        best = seconds if best is None else min(best, seconds)
+    return {
+        'seconds': round(best, 5),
+        'tracemalloc_peak': heap_peak,
+        'raster_peak': raster_peak,
+        'output_bytes': os.path.getsize(path),
+    }
+
+
+def as_displayed(gi, img):
+    """img composited over mid-grey. Color under transparent pixels never
+    shows, and the two engines are free to disagree about it."""
+    from PIL import Image
+    shown = Image.new('RGBA', img.size, SDF_MATTE)
+    shown.alpha_composite(img.convert('RGBA'))
+    return shown.convert('RGB')
+
+
+def sdf_agreement(gi, sizes):
+    """PSNR of the sdf engine against PIL at 8x supersampling, per design and size.
+
+    Covers every design the sdf engine draws. Each must stay above
+    SDF_MIN_PSNR for the two engines to count as compatible.
+    """
+    return {
+        f'{kind}@{size}': round(gi.psnr(as_displayed(gi, gi.render_emblem(kind, size, 8)),
+                                        as_displayed(gi, gi.render_emblem_sdf(kind, size))), 2)
+        for kind in gi.EMBLEMS
+        for size in sizes if SDF_MIN_SIZE <= size <= 1024
+    }
+
+
+def run(sizes, repeat, quick=False):
+    gi = load_generator()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Warm-up: first-call costs (PNG plugin import, codec setup) are not the generator's
+        with contextlib.redirect_stdout(io.StringIO()):
+            gi.generate_icon(16, os.path.join(tmp, 'out.png'))
+        for name, fn in cases(gi, sizes, quick):
+            results[name] = measure(gi, fn, os.path.join(tmp, 'out.png'), repeat)
+            r = results[name]
+            print(f'  {name:<24} {r["seconds"] * 1000:8.1f} ms  '
+                  f'heap {r["tracemalloc_peak"] / 1024:8.0f} KB  '
+                  f'raster {r["raster_peak"] / 1024 / 1024:6.1f} MB')
+    import PIL
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'pillow': PIL.__version__,
+            'machine': platform.machine(),
+            'system': platform.system(),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+    if gi.have_numpy():
+        report['sdf_psnr'] = sdf_agreement(gi, sizes)
+    return report
+
+
+def compare(report, baseline, time_threshold, memory_threshold):
+    """List of human-readable regressions against the baseline report"""
+    regressions = [f'sdf engine for {case}: {value} dB vs PIL, below {SDF_MIN_PSNR} dB'
+                   for case, value in report.get('sdf_psnr', {}).items() if value < SDF_MIN_PSNR]
+    for name, base in baseline['results'].items():
+        cur = report['results'].get(name)
+        if cur is None:
+            continue
+        if (cur['seconds'] > base['seconds'] * (1 + time_threshold)
+                and cur['seconds'] - base['seconds'] > MIN_SECONDS):
+            regressions.append(f'{name}: {base["seconds"] * 1000:.1f} → {cur["seconds"] * 1000:.1f} ms')
+        for key in ('tracemalloc_peak', 'raster_peak'):
+            if (cur[key] > base[key] * (1 + memory_threshold)
+                    and cur[key] - base[key] > MIN_BYTES):
+                regressions.append(f'{name}: {key} {base[key]:,} → {cur[key]:,} bytes')
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark generate-icons.py')
+    parser.add_argument('--sizes', type=int, nargs='+', help='icon sizes to sweep (default: 16-4096)')
+    parser.add_argument('--quick', action='store_true', help='small size sweep and a few splash devices')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per case, best time kept (default: 3)')
+    parser.add_argument('--out', default=REPORT, help=f'report path (default: {REPORT})')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline report to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='write this run as the new baseline')
+    parser.add_argument('--time-threshold', type=float, default=0.25,
+                        help='allowed relative slowdown before failing (default: 0.25)')
+    parser.add_argument('--memory-threshold', type=float, default=0.10,
+                        help='allowed relative memory growth before failing (default: 0.10)')
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else ICON_SIZES)
+    print(f'⏱  Benchmarking generate-icons.py ({args.repeat} runs per case)...\n')
+    report = run(sizes, args.repeat, args.quick)
+
+    out = args.baseline if args.save_baseline else args.out
+    with open(out, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write('\n')
+    print(f'\n✅ Wrote {out}')
+    if args.save_baseline:
+        return
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f'⚠️  No baseline at {args.baseline} — run with --save-baseline first')
+        return
+    regressions = compare(report, baseline, args.time_threshold, args.memory_threshold)
+    for line in regressions:
+        print(f'❌ {line}')
+    if regressions:
+        raise SystemExit(1)
+    print(f'✅ No regressions against {os.path.basename(args.baseline)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,48 +1,112 @@
 #!/usr/bin/env python3
 """Generate Oja POS app icons and splash screen — burnt orange + bold cart"""
 
-from PIL import Image, ImageDraw, ImageFont
+# PIL, numpy, http.server and the process pool are imported by the functions
+# that use them, so --help, up-to-date builds and the other tools never load them
+from collections import OrderedDict, deque, namedtuple
+import argparse
+import functools
+import hashlib
+import importlib.util
+import io
+import json
+import math
 import os
+import re
+import sys
+import threading
+import time
+import urllib.parse
 
 ORANGE = (224, 94, 27)          # #E05E1B burnt orange
 DARK_BG = (28, 25, 23)          # #1C1917 stone-900
 WHITE = (255, 255, 255)
 LIGHT_ORANGE = (245, 158, 100)
 
+# Brand fonts bundled with the app (loaded in src/app/_layout.tsx)
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'fonts')
+FONTS = {
+    'semibold': 'Poppins-SemiBold.ttf',
+    'bold': 'Poppins-Bold.ttf',
+    'extrabold': 'Poppins-ExtraBold.ttf',
+}
 
-def draw_cart(draw, cx, cy, size, color=WHITE, bold=False):
-    """Draw a clean shopping cart icon — bigger and bolder"""
+# Pyramid mode renders each design once at this size and resamples down
+MASTER_SIZE = 2048
+
+# Supersampled pixels per tile — caps the renderer's working set (~16 MB RGBA)
+SS_TILE_PIXELS = 4 * 1024 * 1024
+# Output rows each tile also draws above and below its own, then crops away
+SS_TILE_MARGIN = 1
+
+
+# ─── Geometry ───
+# Shapes are plain tuples shared by every back end:
+#   ('line', (x0, y0, x1, y1), width)
+#   ('arc', (x0, y0, x1, y1), start, end, width)   box is PIL-style, inclusive
+#   ('ellipse', (x0, y0, x1, y1))                    filled
+
+def cart_shapes(cx, cy, size, bold=False):
+    """Clean shopping cart — bigger and bolder"""
     s = size
     lw = max(int(s * 0.09), 4) if bold else max(int(s * 0.07), 3)
 
-    # Handle curve (top-left)
-    arc_box = [cx - s*0.52, cy - s*0.58, cx - s*0.12, cy - s*0.22]
-    draw.arc(arc_box, 180, 275, fill=color, width=lw)
-
     # Cart body — trapezoid
     tl = (cx - s*0.38, cy - s*0.28)
     tr = (cx + s*0.48, cy - s*0.28)
     br = (cx + s*0.38, cy + s*0.22)
     bl = (cx - s*0.28, cy + s*0.22)
 
-    draw.line([tl, tr], fill=color, width=lw)
-    draw.line([tr, br], fill=color, width=lw)
-    draw.line([br, bl], fill=color, width=lw)
-    draw.line([bl, tl], fill=color, width=lw)
-
-    # Shelf line
     mid_y = cy - s*0.03
-    draw.line([(cx - s*0.33, mid_y), (cx + s*0.43, mid_y)], fill=color, width=max(lw*2//3, 2))
-
-    # Legs
     leg_lw = max(lw*2//3, 2)
-    draw.line([(cx - s*0.20, cy + s*0.22), (cx - s*0.20, cy + s*0.34)], fill=color, width=leg_lw)
-    draw.line([(cx + s*0.30, cy + s*0.22), (cx + s*0.30, cy + s*0.34)], fill=color, width=leg_lw)
-
-    # Wheels
     wr = s * 0.08 if bold else s * 0.065
-    draw.ellipse([cx - s*0.20 - wr, cy + s*0.34 - wr, cx - s*0.20 + wr, cy + s*0.34 + wr], fill=color)
-    draw.ellipse([cx + s*0.30 - wr, cy + s*0.34 - wr, cx + s*0.30 + wr, cy + s*0.34 + wr], fill=color)
+
+    return [
+        # Handle curve (top-left)
+        ('arc', (cx - s*0.52, cy - s*0.58, cx - s*0.12, cy - s*0.22), 180, 275, lw),
+        ('line', tl + tr, lw),
+        ('line', tr + br, lw),
+        ('line', br + bl, lw),
+        ('line', bl + tl, lw),
+        # Shelf line
+        ('line', (cx - s*0.33, mid_y, cx + s*0.43, mid_y), max(lw*2//3, 2)),
+        # Legs
+        ('line', (cx - s*0.20, cy + s*0.22, cx - s*0.20, cy + s*0.34), leg_lw),
+        ('line', (cx + s*0.30, cy + s*0.22, cx + s*0.30, cy + s*0.34), leg_lw),
+        # Wheels
+        ('ellipse', (cx - s*0.20 - wr, cy + s*0.34 - wr, cx - s*0.20 + wr, cy + s*0.34 + wr)),
+        ('ellipse', (cx + s*0.30 - wr, cy + s*0.34 - wr, cx + s*0.30 + wr, cy + s*0.34 + wr)),
+    ]
+
+
+def icon_layers(size, circle=0.375, cart=0.42):
+    """(color, shapes) layers of the circle + cart mark, bottom first"""
+    cx, cy = size // 2, size // 2
+    r = int(size * circle)
+    return [
+        (ORANGE, [('ellipse', (cx - r, cy - r, cx + r, cy + r))]),
+        (WHITE, cart_shapes(cx + int(size*0.01), cy, int(size * cart), bold=True)),
+    ]
+
+
+def draw_shapes(draw, shapes, color):
+    for kind, box, *args in shapes:
+        if kind == 'line':
+            draw.line([box[:2], box[2:]], fill=color, width=args[0])
+        elif kind == 'arc':
+            draw.arc(list(box), args[0], args[1], fill=color, width=args[2])
+        else:
+            draw.ellipse(list(box), fill=color)
+
+
+def draw_layers(draw, layers):
+    for color, shapes in layers:
+        draw_shapes(draw, shapes, color)
+
+
+def draw_cart(draw, cx, cy, size, color=WHITE, bold=False):
+    """Draw a clean shopping cart icon — bigger and bolder"""
+    draw_shapes(draw, cart_shapes(cx, cy, size, bold), color)
 
 
 def draw_rounded_rect(draw, bbox, radius, fill):
@@ -55,44 +119,175 @@ def draw_rounded_rect(draw, bbox, radius, fill):
     draw.pieslice([x2-2*radius, y2-2*radius, x2, y2], 0, 90, fill=fill)
 
 
-def generate_icon(size, filename):
-    """App icon — big orange circle, bold white cart, dark bg"""
-    img = Image.new('RGBA', (size, size), DARK_BG)
-    draw = ImageDraw.Draw(img)
+# ─── Fonts ───
 
-    cx, cy = size // 2, size // 2
+@functools.lru_cache(maxsize=None)
+def font_bytes(weight):
+    """Raw TTF bytes — each font file is read once per process"""
+    path = os.path.join(FONT_DIR, FONTS[weight])
+    with open(path, 'rb') as f:
+        return f.read()
 
-    # Orange circle — fills ~75% of the icon
-    r = int(size * 0.375)
-    draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=ORANGE)
 
-    # Cart — fills ~80% of the circle
-    cart_size = int(size * 0.42)
-    draw_cart(draw, cx + int(size*0.01), cy, cart_size, WHITE, bold=True)
+@functools.lru_cache(maxsize=64)
+def load_font(weight, px):
+    """Poppins face at a pixel size, kept in an LRU keyed by (weight, size)"""
+    from PIL import ImageFont
+    return ImageFont.truetype(io.BytesIO(font_bytes(weight)), px)
 
-    img.save(filename, 'PNG')
-    print(f'  ✅ {filename} ({size}x{size})')
 
+@functools.lru_cache(maxsize=512)
+def text_bbox(text, weight, px):
+    return load_font(weight, px).getbbox(text)
 
-def generate_adaptive_icon(size, filename):
-    """Adaptive icon foreground — cart on transparent"""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
-    cx, cy = size // 2, size // 2
+@functools.lru_cache(maxsize=None)
+def _glyph(ch, weight):
+    from PIL import Image, ImageDraw
+    img = Image.new('L', (48, 64), 0)
+    ImageDraw.Draw(img).text((0, 0), ch, fill=255, font=load_font(weight, 40))
+    return img.tobytes()
 
-    r = int(size * 0.30)
-    draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=ORANGE)
 
-    cart_size = int(size * 0.34)
-    draw_cart(draw, cx + int(size*0.01), cy, cart_size, WHITE, bold=True)
+def missing_glyphs(text, weight):
+    """Characters of text the font would draw as the .notdef box"""
+    notdef = _glyph('\uffff', weight)
+    return sorted({ch for ch in text if not ch.isspace() and _glyph(ch, weight) == notdef})
 
-    img.save(filename, 'PNG')
-    print(f'  ✅ {filename} ({size}x{size})')
 
+@functools.lru_cache(maxsize=256)
+def text_mask(text, weight, px):
+    """Coverage mask of a text line — returns (mask, ink width).
 
-def generate_favicon(size, filename):
+    Masks are colorless so one raster serves every theme.
+    """
+    from PIL import Image, ImageDraw
+    missing = missing_glyphs(text, weight)
+    if missing:
+        raise ValueError(f'{FONTS[weight]} has no glyph for {" ".join(missing)} in {text!r}')
+    bbox = text_bbox(text, weight, px)
+    mask = Image.new('L', (max(bbox[2], 1), max(bbox[3], 1)), 0)
+    ImageDraw.Draw(mask).text((0, 0), text, fill=255, font=load_font(weight, px))
+    return mask, bbox[2] - bbox[0]
+
+
+# ─── Supersampled rendering ───
+
+# Largest raster the renderers have held since the last reset, in bytes
+render_stats = {'peak_bytes': 0}
+
+
+def _note_bytes(total):
+    render_stats['peak_bytes'] = max(render_stats['peak_bytes'], total)
+
+
+def _note_raster(*images):
+    _note_bytes(sum(im.width * im.height * len(im.getbands()) for im in images))
+
+
+class ScaledDraw:
+    """ImageDraw stand-in that maps output coordinates onto a supersampled tile.
+
+    Covers the primitives draw_cart and draw_rounded_rect use. Points map to
+    the center of their sample block, boxes to the full block, widths scale.
+    Coordinates are snapped to whole samples before the tile offset is taken
+    off. PIL truncates float coordinates toward zero, so a shape that starts
+    above a tile would otherwise land a sample away from where the tile
+    above drew it.
+    """
+
+    def __init__(self, draw, factor, top=0):
+        self.draw = draw
+        self.f = factor
+        self.top = top
+
+    def _x(self, v):
+        return math.floor(v + 0.5)
+
+    def _y(self, v):
+        return math.floor(v + 0.5) - self.top * self.f
+
+    def _pt(self, p):
+        f = self.f
+        return (self._x(p[0] * f + (f - 1) / 2), self._y(p[1] * f + (f - 1) / 2))
+
+    def _box(self, box):
+        x0, y0, x1, y1 = box
+        f = self.f
+        return [self._x(x0 * f), self._y(y0 * f), self._x(x1 * f + f - 1), self._y(y1 * f + f - 1)]
+
+    def line(self, xy, fill=None, width=1):
+        self.draw.line([self._pt(p) for p in xy], fill=fill, width=width * self.f)
+
+    def arc(self, xy, start, end, fill=None, width=1):
+        self.draw.arc(self._box(xy), start, end, fill=fill, width=width * self.f)
+
+    def ellipse(self, xy, fill=None):
+        self.draw.ellipse(self._box(xy), fill=fill)
+
+    def rectangle(self, xy, fill=None):
+        self.draw.rectangle(self._box(xy), fill=fill)
+
+    def pieslice(self, xy, start, end, fill=None):
+        self.draw.pieslice(self._box(xy), start, end, fill=fill)
+
+
+def render_supersampled(width, height, background, paint, samples=1):
+    """Run paint(draw) at samples x resolution, one horizontal tile at a time.
+
+    Each tile is box-downsampled into the output before the next is drawn,
+    so the working set is one tile of at most SS_TILE_PIXELS plus the
+    output, whatever the output size and sample factor. Tiles are drawn
+    SS_TILE_MARGIN rows taller at each side and cropped before the
+    downsample, so edges that straddle a seam come out as in an untiled
+    render.
+    """
+    from PIL import Image, ImageDraw
+    img = Image.new('RGBA', (width, height), background)
+    if samples == 1:
+        paint(ImageDraw.Draw(img))
+        _note_raster(img)
+        return img
+
+    rows = max(1, SS_TILE_PIXELS // (width * samples * samples))
+    for top in range(0, height, rows):
+        h = min(rows, height - top)
+        y0, y1 = max(top - SS_TILE_MARGIN, 0), min(top + h + SS_TILE_MARGIN, height)
+        tile = Image.new('RGBA', (width * samples, (y1 - y0) * samples), background)
+        paint(ScaledDraw(ImageDraw.Draw(tile), samples, y0))
+        _note_raster(img, tile)
+        crop = (0, (top - y0) * samples, width * samples, (top - y0 + h) * samples)
+        img.paste(tile.reduce(samples, box=crop), (0, top))
+    return img
+
+
+# kind -> (background, circle radius, cart size) as fractions of the icon
+EMBLEMS = {
+    # Orange circle fills ~75% of the icon, cart ~80% of the circle
+    'icon': (DARK_BG, 0.375, 0.42),
+    'adaptive': ((0, 0, 0, 0), 0.30, 0.34),
+}
+
+
+def render_emblem(kind, size, samples=1):
+    background, circle, cart = EMBLEMS[kind]
+    layers = icon_layers(size, circle, cart)
+    return render_supersampled(size, size, background, functools.partial(draw_layers, layers=layers), samples)
+
+
+def render_icon(size, samples=1):
+    """App icon — big orange circle, bold white cart, dark bg"""
+    return render_emblem('icon', size, samples)
+
+
+def render_adaptive_icon(size, samples=1):
+    """Adaptive icon foreground — cart on transparent"""
+    return render_emblem('adaptive', size, samples)
+
+
+def render_favicon(size):
     """Favicon — bold O lettermark in orange circle, clean at 16-48px"""
+    from PIL import Image, ImageDraw
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
@@ -101,68 +296,1550 @@ def generate_favicon(size, filename):
     draw.ellipse([pad, pad, size - pad, size - pad], fill=ORANGE)
 
     # Bold "O" letter
-    try:
-        font_size = int(size * 0.6)
-        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-    except:
-        font = ImageFont.load_default()
-
-    bbox = draw.textbbox((0, 0), "O", font=font)
-    tw = bbox[2] - bbox[0]
+    font_size = int(size * 0.6)
+    bbox = text_bbox("O", 'extrabold', font_size)
+    mask, tw = text_mask("O", 'extrabold', font_size)
     th = bbox[3] - bbox[1]
     tx = (size - tw) // 2
     ty = (size - th) // 2 - bbox[1]
-    draw.text((tx, ty), "O", fill=WHITE, font=font)
+    img.paste(WHITE, (tx, ty, tx + mask.width, ty + mask.height), mask)
 
-    img.save(filename, 'PNG')
-    print(f'  ✅ {filename} ({size}x{size})')
+    _note_raster(img, mask)
+    return img
 
 
-def generate_splash(width, height, filename):
-    """Splash screen — cart icon + text"""
-    img = Image.new('RGBA', (width, height), DARK_BG)
-    draw = ImageDraw.Draw(img)
+# ─── Signed-distance-field engine ───
+# Evaluates the same shapes as vectorized distance fields, giving
+# anti-aliased coverage at any resolution without supersampling. Each
+# shape is only evaluated over its own bounding box.
+
+def have_numpy():
+    """numpy is optional (only this engine uses it); checked without importing it"""
+    return importlib.util.find_spec('numpy') is not None
+
+
+def _sd_ellipse(x, y, x0, y0, x1, y1):
+    """Approximate signed distance to a filled PIL-style (inclusive) ellipse box"""
+    import numpy as np
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    a, b = (x1 - x0) / 2 + 0.5, (y1 - y0) / 2 + 0.5
+    px, py = x - cx, y - cy
+    g = (px / a) ** 2 + (py / b) ** 2 - 1
+    grad = 2 * np.sqrt((px / a**2) ** 2 + (py / b**2) ** 2) + 1e-9
+    return g / grad
+
+
+def _sd_line(x, y, x0, y0, x1, y1, width):
+    """Signed distance to a flat-capped stroke, like PIL's wide lines"""
+    import numpy as np
+    dx, dy = x1 - x0, y1 - y0
+    length = np.sqrt(dx * dx + dy * dy) + 1e-9
+    ux, uy = dx / length, dy / length
+    px, py = x - x0, y - y0
+    qx = np.abs(px * ux + py * uy - length / 2) - length / 2
+    qy = np.abs(px * uy - py * ux) - width / 2
+    outside = np.sqrt(np.maximum(qx, 0) ** 2 + np.maximum(qy, 0) ** 2)
+    return outside + np.minimum(np.maximum(qx, qy), 0)
+
+
+def _sd_arc(x, y, x0, y0, x1, y1, start, end, width):
+    """Signed distance to a PIL arc: an ellipse band of width cut to a wedge.
+
+    The wedge is the intersection of two half-planes, so arcs must span
+    less than 180 degrees (the cart handle spans 95).
+    """
+    import numpy as np
+    band = np.maximum(_sd_ellipse(x, y, x0, y0, x1, y1),
+                      -_sd_ellipse(x, y, x0 + width, y0 + width, x1 - width, y1 - width))
+    # Degrees run clockwise from 3 o'clock on screen, as in PIL
+    px, py = x - (x0 + x1) / 2, y - (y0 + y1) / 2
+    s, e = np.radians(start), np.radians(end)
+    wedge = np.maximum(-(np.cos(s) * py - np.sin(s) * px),
+                       -(px * np.sin(e) - py * np.cos(e)))
+    return np.maximum(band, wedge)
+
+
+def _sd_shape(x, y, kind, box, *args):
+    if kind == 'line':
+        return _sd_line(x, y, *box, args[0])
+    if kind == 'arc':
+        return _sd_arc(x, y, *box, *args)
+    return _sd_ellipse(x, y, *box)
+
+
+def _shape_bounds(shape, width, height):
+    """Integer pixel window that holds all of a shape's coverage"""
+    kind, (x0, y0, x1, y1), *args = shape
+    pad = (args[-1] / 2 if kind == 'line' else 0) + 2
+    return (max(int(min(x0, x1) - pad), 0), max(int(min(y0, y1) - pad), 0),
+            min(int(max(x0, x1) + pad) + 1, width), min(int(max(y0, y1) + pad) + 1, height))
+
+
+def render_sdf(width, height, background, layers):
+    """Rasterize (color, shapes) layers with the SDF engine.
+
+    Coverage is clip(0.5 - distance); a layer's shapes are unioned by
+    taking the max coverage, then the layer is composited premultiplied.
+    """
+    if not have_numpy():
+        raise RuntimeError('the sdf engine needs numpy (pip install numpy)')
+    from PIL import Image
+    import numpy as np
+    bg = tuple(background) + (255,) * (4 - len(background))
+    alpha = np.full((height, width), bg[3] / 255, np.float32)
+    rgb = [np.full((height, width), c * bg[3] / 255, np.float32) for c in bg[:3]]
+
+    for color, shapes in layers:
+        cover = np.zeros((height, width), np.float32)
+        for shape in shapes:
+            x0, y0, x1, y1 = _shape_bounds(shape, width, height)
+            if x0 >= x1 or y0 >= y1:
+                continue
+            xs = np.arange(x0, x1, dtype=np.float32)[None, :]
+            ys = np.arange(y0, y1, dtype=np.float32)[:, None]
+            region = cover[y0:y1, x0:x1]
+            np.maximum(region, np.clip(0.5 - _sd_shape(xs, ys, *shape), 0, 1), out=region)
+        for i in range(3):
+            rgb[i] += (color[i] - rgb[i]) * cover
+        alpha += (1 - alpha) * cover
+
+    safe = np.where(alpha > 0, alpha, 1)
+    pixels = np.stack([c / safe for c in rgb] + [alpha * 255], axis=-1)
+    img = Image.fromarray(np.clip(pixels + 0.5, 0, 255).astype(np.uint8), 'RGBA')
+    # rgb + alpha + cover + the stacked float copy, plus the 8-bit output
+    _note_bytes(width * height * (4 * 9 + 4))
+    return img
+
+
+def render_emblem_sdf(kind, size):
+    """SDF counterpart of render_emblem — no samples factor needed"""
+    background, circle, cart = EMBLEMS[kind]
+    return render_sdf(size, size, background, icon_layers(size, circle, cart))
+
+
+def render_sdf_batch(kind, sizes):
+    """Rasterize one emblem at many sizes — returns {size: Image}"""
+    return {size: render_emblem_sdf(kind, size) for size in sizes}
+
+
+# ─── SVG export ───
+# Same shapes as the raster engines. PIL boxes are inclusive pixel indices,
+# so SVG coordinates sit half a pixel further in (pixel centers).
+
+# viewBox size the geometry is evaluated at — SVG scales it from there
+SVG_SIZE = 512
+
+
+def _num(v):
+    """Shortest decimal for v at 0.1 px precision"""
+    return f'{round(v, 1):g}'
+
+
+def _hex(color):
+    digits = ''.join(f'{c:02x}' for c in color[:3])
+    if digits[::2] == digits[1::2]:
+        digits = digits[::2]        # #ffffff -> #fff
+    return '#' + digits
+
+
+def svg_shape(shape):
+    """(element, stroke width) for one shape — width is None for fills"""
+    kind, (x0, y0, x1, y1), *args = shape
+    if kind == 'line':
+        return f'M{_num(x0 + .5)} {_num(y0 + .5)}L{_num(x1 + .5)} {_num(y1 + .5)}', args[0]
+
+    cx, cy = (x0 + x1) / 2 + .5, (y0 + y1) / 2 + .5
+    rx, ry = (x1 - x0) / 2 + .5, (y1 - y0) / 2 + .5
+    if kind == 'ellipse':
+        # Compare at output precision: radii a float-rounding apart are a circle
+        rx, ry = _num(rx), _num(ry)
+        if rx == ry:
+            return f'<circle cx="{_num(cx)}" cy="{_num(cy)}" r="{rx}"/>', None
+        return f'<ellipse cx="{_num(cx)}" cy="{_num(cy)}" rx="{rx}" ry="{ry}"/>', None
+
+    # PIL arcs grow inward from the box; an SVG stroke is centered on its path
+    start, end, width = args
+    rx, ry = rx - width / 2, ry - width / 2
+    a, b = math.radians(start), math.radians(end)
+    large = 1 if end - start > 180 else 0
+    return (f'M{_num(cx + rx * math.cos(a))} {_num(cy + ry * math.sin(a))}'
+            f'A{_num(rx)} {_num(ry)} 0 {large} 1 {_num(cx + rx * math.cos(b))} {_num(cy + ry * math.sin(b))}',
+            width)
+
+
+def render_svg(kind, size=SVG_SIZE):
+    """Minified SVG of a circle + cart emblem"""
+    background, circle, cart = EMBLEMS[kind]
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {size} {size}">']
+    if len(background) == 3 or background[3]:
+        parts.append(f'<rect width="{size}" height="{size}" fill="{_hex(background)}"/>')
+
+    for color, shapes in icon_layers(size, circle, cart):
+        fills, strokes = [], {}
+        for shape in shapes:
+            element, width = svg_shape(shape)
+            if width is None:
+                fills.append(element)
+            else:
+                strokes.setdefault(width, []).append(element)
+        parts.append(f'<g fill="{_hex(color)}">{"".join(fills)}</g>' if len(fills) > 1
+                     else fills[0].replace('/>', f' fill="{_hex(color)}"/>') if fills else '')
+        for width, paths in strokes.items():
+            parts.append(f'<path d="{"".join(paths)}" fill="none" stroke="{_hex(color)}" '
+                         f'stroke-width="{_num(width)}"/>')
+
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+# ─── Splash layers ───
+
+# theme -> (background, title, tagline)
+SPLASH_THEMES = {
+    'dark': (DARK_BG, WHITE, LIGHT_ORANGE),
+    'light': ((250, 250, 249), DARK_BG, ORANGE),    # stone-50 bg
+}
+
+# Same languages as src/i18n. The bundled Poppins has no dot-below letters
+# (ṣ, ẹ, ọ, ụ, ị), so Yoruba and Igbo are written without them here.
+SPLASH_TAGLINES = {
+    'en': 'The POS Built for Nigerian Shops',
+    'pcm': 'The POS Wey Dem Build for Naija Shops',
+    'yo': 'POS Tí A Se Fún Àwon Sóòbù Nàìjíríà',
+    'ha': 'POS Da Aka Gina Don Shagunan Najeriya',
+    'ig': 'POS E Mere Maka Ulo Ahia Naijiria',
+}
+
+
+@functools.lru_cache(maxsize=64)
+def emblem_layer(r, cart_size, cart_dx, samples=1):
+    """Orange circle + bold white cart on transparent, (2r+1) square"""
+    def paint(draw):
+        draw.ellipse([0, 0, 2*r, 2*r], fill=ORANGE)
+        draw_cart(draw, r + cart_dx, r, cart_size, WHITE, bold=True)
+
+    return render_supersampled(2*r + 1, 2*r + 1, (0, 0, 0, 0), paint, samples)
+
+
+def paste_text(img, text, weight, px, color, cx, y):
+    """Stamp a cached text mask in color, centered on cx"""
+    mask, tw = text_mask(text, weight, px)
+    img.paste(color, (cx - tw//2, y, cx - tw//2 + mask.width, y + mask.height), mask)
+
+
+def render_splash(width, height, theme='dark', lang='en', samples=1):
+    """Splash screen — cart icon + text, composited from cached layers"""
+    from PIL import Image
+    bg, title_color, tag_color = SPLASH_THEMES[theme]
+    img = Image.new('RGBA', (width, height), bg)
 
     cx, cy = width // 2, height // 2 - int(height * 0.06)
 
-    # Orange circle
+    # Orange circle + cart
     r = int(min(width, height) * 0.18)
-    draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=ORANGE)
-
-    # Cart
     cart_size = int(min(width, height) * 0.22)
-    draw_cart(draw, cx + int(width*0.005), cy, cart_size, WHITE, bold=True)
+    img.alpha_composite(emblem_layer(r, cart_size, int(width*0.005), samples), (cx - r, cy - r))
 
     # Text
     text_y = cy + r + int(height * 0.04)
-    try:
-        font_large = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", int(height * 0.05))
-        font_small = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", int(height * 0.022))
-    except:
-        font_large = ImageFont.load_default()
-        font_small = ImageFont.load_default()
+    paste_text(img, "Oja POS", 'bold', int(height * 0.05), title_color, cx, text_y)
 
-    bbox = draw.textbbox((0, 0), "Oja POS", font=font_large)
-    tw = bbox[2] - bbox[0]
-    draw.text((cx - tw//2, text_y), "Oja POS", fill=WHITE, font=font_large)
-
-    tag = "The POS Built for Nigerian Shops"
     tag_y = text_y + int(height * 0.065)
-    bbox = draw.textbbox((0, 0), tag, font=font_small)
-    tw = bbox[2] - bbox[0]
-    draw.text((cx - tw//2, tag_y), tag, fill=LIGHT_ORANGE, font=font_small)
+    paste_text(img, SPLASH_TAGLINES[lang], 'semibold', int(height * 0.022), tag_color, cx, tag_y)
+
+    _note_raster(img)
+    return img
+
 
+def save(img, filename):
     img.save(filename, 'PNG')
-    print(f'  ✅ {filename} ({width}x{height})')
+    print(f'  ✅ {filename} ({img.width}x{img.height})')
+
+
+def generate_icon(size, filename):
+    save(render_icon(size), filename)
+
+
+def generate_adaptive_icon(size, filename):
+    save(render_adaptive_icon(size), filename)
+
+
+def generate_favicon(size, filename):
+    save(render_favicon(size), filename)
+
+
+def generate_splash(width, height, filename):
+    save(render_splash(width, height), filename)
+
+
+# ─── Master + resampling pyramid ───
+
+# design -> (renderer, master width, master height)
+DESIGNS = {
+    'icon': (render_icon, MASTER_SIZE, MASTER_SIZE),
+    'adaptive': (render_adaptive_icon, MASTER_SIZE, MASTER_SIZE),
+    'favicon': (render_favicon, MASTER_SIZE, MASTER_SIZE),
+    'splash': (render_splash, 1284, 2778),
+}
+
+_pyramids = {}
+
+
+def render_design(design, width, height, samples=1):
+    """Draw a design directly at width x height"""
+    renderer = DESIGNS[design][0]
+    if renderer is render_splash:
+        return renderer(width, height, samples=samples)
+    if renderer is render_favicon:
+        return renderer(width)      # text + one circle, nothing to supersample
+    return renderer(width, samples)
+
+
+def render_master(design):
+    """Draw a design once at its master resolution"""
+    _, w, h = DESIGNS[design]
+    return render_design(design, w, h)
+
+
+def pyramid_level(design, width, height):
+    """Smallest cached level of the design's pyramid that is still >= width x height.
+
+    Level 0 is the master; each further level halves it with a 2x2 box reduce.
+    Levels are built lazily and kept for the life of the process.
+    """
+    levels = _pyramids.get(design)
+    if levels is None:
+        levels = _pyramids[design] = [render_master(design)]
+    if width > levels[0].width or height > levels[0].height:
+        raise ValueError(f'{design}: {width}x{height} is larger than the '
+                         f'{levels[0].width}x{levels[0].height} master')
+
+    for level in reversed(levels):
+        if level.width >= width and level.height >= height:
+            break
+    while level is levels[-1] and level.width // 2 >= width and level.height // 2 >= height:
+        level = level.reduce(2)
+        levels.append(level)
+    return level
+
+
+def derive(design, width, height=None):
+    """Resample a design to width x height from the nearest larger pyramid level"""
+    from PIL import Image
+    height = height or width
+    level = pyramid_level(design, width, height)
+    out = level.copy() if level.size == (width, height) else level.resize((width, height), Image.LANCZOS)
+    # The level stays cached, so it counts alongside the output
+    _note_raster(level, out)
+    return out
+
+
+def generate_from_master(design, width, height, filename):
+    save(derive(design, width, height), filename)
+
+
+def clear_caches(fonts=True):
+    """Drop pyramids and cached layers (and loaded fonts) — for cold timings"""
+    _pyramids.clear()
+    emblem_layer.cache_clear()
+    text_mask.cache_clear()
+    text_bbox.cache_clear()
+    if fonts:
+        load_font.cache_clear()
+        font_bytes.cache_clear()
+        _glyph.cache_clear()
+
+
+# ─── Target manifest ───
+
+# budget is the most bytes the optimized PNG may take (None = unlimited);
+# samples is the supersampling factor for direct renders;
+# theme and lang only apply to splash targets;
+# formats are extra encodings written next to path (same name, new extension)
+Target = namedtuple('Target', 'name kind width height path budget samples theme lang formats',
+                    defaults=(None, 1, 'dark', 'en', ()))
+
+KB = 1024
+
+TARGETS = [
+    Target('icon', 'icon', 1024, 1024, 'assets/icon.png', 16 * KB, 2),
+    Target('adaptive-icon', 'adaptive', 1024, 1024, 'assets/adaptive-icon.png', 16 * KB, 2),
+    Target('favicon', 'favicon', 48, 48, 'assets/favicon.png', 2 * KB),
+    Target('splash-icon', 'icon', 512, 512, 'assets/splash-icon.png', 8 * KB, 4),
+    Target('splash-full', 'splash', 1284, 2778, 'assets/splash-full.png', 48 * KB, 2,
+           formats=('webp',)),
+    # public/ icons are precached by sw.js on every PWA install
+    Target('pwa-512', 'icon', 512, 512, 'public/icon-512.png', 8 * KB, 4, formats=('webp',)),
+    Target('pwa-192', 'icon', 192, 192, 'public/icon-192.png', 4 * KB, 4, formats=('webp',)),
+    Target('apple-touch-icon', 'icon', 180, 180, 'public/apple-touch-icon.png', 4 * KB, 4),
+    # Vector icon + favicon for browsers that take SVG; size is the viewBox
+    Target('icon-svg', 'icon', SVG_SIZE, SVG_SIZE, 'public/icon.svg', 1 * KB),
+]
+
+
+# Splash device matrix: (device, width, height) in portrait
+SPLASH_DEVICES = [
+    ('iphone-se', 750, 1334),
+    ('iphone-xr', 828, 1792),
+    ('iphone-x', 1125, 2436),
+    ('iphone-14', 1170, 2532),
+    ('iphone-15', 1179, 2556),
+    ('iphone-xs-max', 1242, 2688),
+    ('iphone-14-plus', 1284, 2778),
+    ('iphone-15-pro-max', 1290, 2796),
+    ('ipad', 1536, 2048),
+    ('ipad-air', 1640, 2360),
+    ('ipad-pro-11', 1668, 2388),
+    ('ipad-pro-12.9', 2048, 2732),
+    ('android-hd', 720, 1280),
+    ('android-fhd', 1080, 1920),
+    ('android-fhd-plus', 1080, 2400),
+    ('android-qhd', 1440, 2560),
+    ('android-qhd-plus', 1440, 3200),
+]
+
+
+def splash_matrix(themes=None, langs=None):
+    """Targets for every device x theme x language splash variant"""
+    return [
+        Target(f'splash-{device}-{theme}-{lang}', 'splash', w, h,
+               f'assets/splash/{device}-{theme}-{lang}.png', 48 * KB, 2, theme, lang)
+        for device, w, h in SPLASH_DEVICES
+        for theme in themes or SPLASH_THEMES
+        for lang in langs or SPLASH_TAGLINES
+    ]
+
+
+def can_derive(target):
+    """Pyramid levels only hold the default theme/language at the master's aspect ratio.
+
+    The favicon is always drawn directly: it is hinted for 16-48px, and its
+    lettermark picks up a LANCZOS halo when resampled from the master.
+    Drawing it costs next to nothing anyway.
+    """
+    if target.kind == 'favicon':
+        return False
+    _, w, h = DESIGNS[target.kind]
+    return (target.theme, target.lang) == ('dark', 'en') and target.width * h == target.height * w
+
+
+ENGINES = ('pil', 'sdf')
+
+
+def render_target(target, pyramid=False, engine='pil'):
+    """Render one manifest target, either directly or from its design's master.
+
+    The sdf engine covers the circle + cart emblems; other kinds use PIL.
+    """
+    if pyramid and can_derive(target):
+        return derive(target.kind, target.width, target.height)
+    if engine == 'sdf' and target.kind in EMBLEMS:
+        return render_emblem_sdf(target.kind, target.width)
+    if target.kind == 'splash':
+        return render_splash(target.width, target.height, target.theme, target.lang, target.samples)
+    return render_design(target.kind, target.width, target.height, target.samples)
+
+
+# ─── PNG optimizer ───
+
+# Lossy candidates (palette quantization) must stay at or above this PSNR
+MIN_PSNR = 42.0
+QUANTIZE_COLORS = (256, 128, 64, 32)
+ZLIB_LEVELS = (6, 9)
+# zlib strategies: default, filtered, RLE
+ZLIB_STRATEGIES = (0, 1, 3)
+# optimize_png labels: candidate, zlib level, strategy — e.g. 'p32 z9s0'
+PNG_LABEL = re.compile(r'^(\w+) z(\d)s(\d)$')
+
+
+def psnr(a, b):
+    """Peak signal-to-noise ratio between two same-size images, in dB"""
+    from PIL import ImageChops, ImageStat
+    stat = ImageStat.Stat(ImageChops.difference(a, b.convert(a.mode)))
+    mse = sum(stat.sum2) / (len(stat.sum2) * a.width * a.height)
+    return math.inf if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+
+
+# Chunks a PNG keeps: the critical ones plus tRNS, which carries palette
+# alpha. Text, time, density, color-profile and EXIF chunks are dropped, so
+# the same pixels always encode to the same bytes.
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+PNG_CHUNKS = {b'IHDR', b'PLTE', b'tRNS', b'IDAT', b'IEND'}
+
+
+def strip_png(data):
+    """data without ancillary chunks (anything but a PNG comes back unchanged)"""
+    if not data.startswith(PNG_SIGNATURE):
+        return data
+    out, i = [PNG_SIGNATURE], len(PNG_SIGNATURE)
+    while i + 8 <= len(data):
+        end = i + 12 + int.from_bytes(data[i:i + 4], 'big')
+        if data[i + 4:i + 8] in PNG_CHUNKS:
+            out.append(data[i:end])
+        i = end
+    return b''.join(out)
+
+
+def encode_image(img, fmt, **options):
+    buf = io.BytesIO()
+    img.save(buf, fmt, **options)
+    return strip_png(buf.getvalue())
+
+
+def png_variants(img, colors=QUANTIZE_COLORS):
+    """Yield (label, image) candidates that stay within MIN_PSNR of img"""
+    from PIL import Image
+    if img.mode == 'RGBA' and img.getextrema()[3][0] == 255:
+        img = img.convert('RGB')
+        yield 'rgb', img
+    else:
+        yield img.mode.lower(), img
+
+    # Only the fewest-colors palette that passes is worth encoding
+    best = None
+    for n in colors:
+        quantized = img.quantize(n, method=Image.Quantize.FASTOCTREE)
+        if psnr(img, quantized) < MIN_PSNR:
+            break
+        best = f'p{n}', quantized
+    if best:
+        yield best
+
+
+def optimize_png(img, reuse=None):
+    """Smallest PNG encoding of img — returns (bytes, label)
+
+    Tries dropping an opaque alpha channel, palette quantization down to the
+    fewest colors that still meet MIN_PSNR, and each zlib level x strategy.
+
+    reuse is the label of an earlier result for a near-identical image (the
+    other themes and languages of one splash device): only that candidate,
+    level and strategy are encoded. If its palette no longer meets MIN_PSNR
+    the full search runs instead.
+    """
+    if reuse:
+        variant, level, strategy = PNG_LABEL.match(reuse).groups()
+        colors = (int(variant[1:]),) if variant.startswith('p') else ()
+        for label, candidate in png_variants(img, colors):
+            if label == variant:
+                return encode_image(candidate, 'PNG', compress_level=int(level),
+                                    compress_type=int(strategy)), reuse
+    best = None
+    for label, variant in png_variants(img):
+        for level in ZLIB_LEVELS:
+            for strategy in ZLIB_STRATEGIES:
+                data = encode_image(variant, 'PNG', compress_level=level, compress_type=strategy)
+                if best is None or len(data) < len(best[0]):
+                    best = (data, f'{label} z{level}s{strategy}')
+    return best
+
+
+# ─── Alternate formats ───
+
+# Lossy WebP qualities, floor first — the first that keeps MIN_PSNR is the
+# smallest lossy candidate
+WEBP_QUALITIES = (80, 85, 90, 95)
+WEBP_METHOD = 6
+
+
+def optimize_webp(img):
+    """Smallest WebP of img — returns (bytes, label)
+
+    Candidates are lossless encodes of each PNG variant (so palette
+    quantization carries over) and the lowest lossy quality at or above
+    the floor that still meets MIN_PSNR.
+    """
+    from PIL import Image
+    best = None
+    for label, variant in png_variants(img):
+        data = encode_image(variant.convert(img.mode), 'WEBP', lossless=True, method=WEBP_METHOD)
+        if best is None or len(data) < len(best[0]):
+            best = (data, f'lossless {label}')
+    for quality in WEBP_QUALITIES:
+        data = encode_image(img, 'WEBP', quality=quality, method=WEBP_METHOD)
+        if psnr(img, Image.open(io.BytesIO(data))) >= MIN_PSNR:
+            if len(data) < len(best[0]):
+                best = (data, f'q{quality}')
+            break
+    return best
+
+
+ENCODERS = {
+    'webp': optimize_webp,
+}
+
+
+def output_paths(target):
+    """Primary output first, then one sibling per extra format"""
+    stem = os.path.splitext(target.path)[0]
+    return [target.path] + [f'{stem}.{fmt}' for fmt in target.formats]
+
+
+# ─── Web manifest ───
+
+WEB_ROOT = 'public'
+WEB_MANIFEST = 'public/manifest.json'
+SERVICE_WORKER = 'public/sw.js'
+# output path -> {hash, bytes} for every generated file
+ASSET_MANIFEST = 'public/asset-manifest.json'
+
+# Targets whose primary output the service worker precaches by revision
+PRECACHE_TARGETS = ['pwa-192', 'pwa-512', 'icon-svg']
+
+# Targets listed as icons in the web manifest, with their purpose
+WEB_MANIFEST_ICONS = [
+    ('icon-svg', 'any'),
+    ('pwa-192', 'any'),
+    ('pwa-192', 'maskable'),
+    ('pwa-512', 'any'),
+    ('pwa-512', 'maskable'),
+]
+
+# Smallest-first: browsers take the first entry whose type they support
+MIME_TYPES = {
+    '.svg': 'image/svg+xml',
+    '.webp': 'image/webp',
+    '.png': 'image/png',
+}
+
+
+def web_icon_entries(targets):
+    """Manifest icon entries for every output on disk, type-ordered per size"""
+    by_name = {t.name: t for t in targets}
+    entries = []
+    for name, purpose in WEB_MANIFEST_ICONS:
+        target = by_name[name]
+        order = list(MIME_TYPES)
+        for path in sorted(output_paths(target), key=lambda p: order.index(os.path.splitext(p)[1])):
+            if not os.path.exists(path):
+                continue
+            ext = os.path.splitext(path)[1]
+            entries.append({
+                'src': '/' + os.path.relpath(path, WEB_ROOT).replace(os.sep, '/'),
+                'sizes': 'any' if ext == '.svg' else f'{target.width}x{target.height}',
+                'type': MIME_TYPES[ext],
+                'purpose': purpose,
+            })
+    return entries
+
+
+def _write_text_if_changed(path, text):
+    try:
+        with open(path) as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    with open(path, 'w') as f:
+        f.write(text)
+    return True
+
+
+def _json(obj):
+    return json.dumps(obj, indent=2, ensure_ascii=False) + '\n'
+
+
+def update_web_manifest(targets, path=WEB_MANIFEST):
+    """Rewrite the icons list of the web manifest — returns True if it changed"""
+    with open(path) as f:
+        manifest = json.load(f)
+    manifest['icons'] = web_icon_entries(targets)
+    return _write_text_if_changed(path, _json(manifest))
+
+
+def content_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def asset_manifest(targets):
+    """{output path: {hash, bytes}} for every output of targets that exists"""
+    entries = {}
+    for target in targets:
+        for path in output_paths(target):
+            if os.path.exists(path):
+                entries[path] = {'hash': content_hash(path), 'bytes': os.path.getsize(path)}
+    return dict(sorted(entries.items()))
+
+
+def update_asset_manifest(targets, path=ASSET_MANIFEST):
+    return _write_text_if_changed(path, _json(asset_manifest(targets)))
+
+
+def update_precache(targets, path=SERVICE_WORKER):
+    """Regenerate the PRECACHE_MANIFEST block in sw.js from content hashes.
+
+    sw.js only changes when a precached file does, which is what makes
+    browsers install the new worker; it then fetches just those files.
+    """
+    by_name = {t.name: t for t in targets}
+    lines = []
+    for name in PRECACHE_TARGETS:
+        # Alternate formats too: the manifest offers them, so browsers ask for them
+        for out in output_paths(by_name[name]):
+            if os.path.exists(out):
+                url = '/' + os.path.relpath(out, WEB_ROOT).replace(os.sep, '/')
+                lines.append(f"  {{ url: '{url}', revision: '{content_hash(out)}' }},")
+    block = 'const PRECACHE_MANIFEST = [\n' + '\n'.join(lines) + '\n];\n'
+
+    with open(path) as f:
+        sw = f.read()
+    head, rest = sw.split('// precache:start', 1)
+    marker, rest = rest.split('\n', 1)
+    _, tail = rest.split('// precache:end', 1)
+    return _write_text_if_changed(path, f'{head}// precache:start{marker}\n{block}// precache:end{tail}')
+
+
+def update_web(targets):
+    """Refresh everything the web build derives from the generated files"""
+    changed = []
+    if update_web_manifest(targets):
+        changed.append(WEB_MANIFEST)
+    if update_asset_manifest(targets):
+        changed.append(ASSET_MANIFEST)
+    if update_precache(targets):
+        changed.append(SERVICE_WORKER)
+    return changed
+
+
+# ─── Incremental build cache ───
+
+CACHE_FILE = '.icon-cache/build.json'
+
+
+@functools.lru_cache(maxsize=None)
+def _file_digest(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return 'missing'
+
+
+def input_key(target, pyramid=False, engine='pil'):
+    """Hash of everything that can change a target's pixels.
+
+    Covers the target itself, the palette and proportions (which a
+    parameters file may override), the font file bytes and this script's
+    source (the drawing code version).
+    """
+    h = hashlib.sha256()
+    h.update(repr((tuple(target), pyramid, engine, MASTER_SIZE,
+                   ORANGE, DARK_BG, WHITE, LIGHT_ORANGE,
+                   sorted(EMBLEMS.items()), sorted(SPLASH_THEMES.items()),
+                   MIN_PSNR, QUANTIZE_COLORS, ZLIB_LEVELS, ZLIB_STRATEGIES,
+                   WEBP_QUALITIES, WEBP_METHOD)).encode())
+    for name in sorted(FONTS.values()):
+        h.update(_file_digest(os.path.join(FONT_DIR, name)).encode())
+    h.update(_file_digest(os.path.abspath(__file__)).encode())
+    return h.hexdigest()
+
+
+def _stamp(path):
+    """(size, mtime) of an output, so edits made outside the build are noticed"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def load_cache(path=CACHE_FILE):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache, path=CACHE_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def is_fresh(cache, target, key):
+    entry = cache.get(target.path)
+    return (bool(entry) and entry['key'] == key
+            and entry.get('stamps') == [_stamp(p) for p in output_paths(target)])
+
+
+def same_pixels(a, b):
+    return a.size == b.size and a.convert('RGBA').tobytes() == b.convert('RGBA').tobytes()
+
+
+def write_if_changed(data, path):
+    """Write encoded image bytes unless the file on disk already holds the same
+    pixels (and no PNG metadata the encoder would strip)"""
+    from PIL import Image
+    try:
+        with open(path, 'rb') as f:
+            old = f.read()
+        same = old == data or (strip_png(old) == old and
+                               same_pixels(Image.open(io.BytesIO(old)), Image.open(io.BytesIO(data))))
+    except (OSError, ValueError):
+        same = False
+    if same:
+        return False
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+# extras holds (path, size, encoding) for each alternate format
+Built = namedtuple('Built', 'target seconds written size encoding render_seconds peak_bytes extras')
+
+
+def encode_target(target, pyramid=False, engine='pil', reuse=None):
+    """Render one target and encode all its outputs in memory; nothing is written.
+
+    Returns ([(path, bytes, encoding)], render seconds), primary output
+    first (see output_paths). reuse is passed on to optimize_png.
+    """
+    start = time.perf_counter()
+    if target.path.endswith('.svg'):
+        data = render_svg(target.kind, target.width).encode()
+        return [(target.path, data, 'svg')], time.perf_counter() - start
+    img = render_target(target, pyramid, engine)
+    render_seconds = time.perf_counter() - start
+    outputs = [(target.path, *optimize_png(img, reuse))]
+    for fmt, path in zip(target.formats, output_paths(target)[1:]):
+        outputs.append((path, *ENCODERS[fmt](img)))
+    return outputs, render_seconds
+
+
+def over_budget(target, size):
+    return target.budget is not None and size > target.budget
+
+
+def build_target(target, pyramid=False, engine='pil', reuse=None):
+    """Render, optimize and write one target and its alternates.
+
+    A target whose primary output is over its budget writes nothing, so the
+    files already on disk stay as they were.
+    """
+    start = time.perf_counter()
+    render_stats['peak_bytes'] = 0
+    outputs, render_seconds = encode_target(target, pyramid, engine, reuse)
+    (_, data, encoding), extras = outputs[0], outputs[1:]
+    written = [] if over_budget(target, len(data)) else [write_if_changed(out, path)
+                                                         for path, out, _ in outputs]
+    return Built(target, time.perf_counter() - start, any(written), len(data), encoding,
+                 render_seconds, render_stats['peak_bytes'],
+                 [(path, len(alt), label) for path, alt, label in extras])
+
+
+def build_group(targets, pyramid=False, engine='pil'):
+    """Worker entry point — build targets of one kind and size in turn.
+
+    These are the themes and languages of one splash device, so they share
+    the worker's emblem and text caches, and the PNG encoder search runs
+    for the first only.
+    """
+    built, reuse = [], None
+    for target in targets:
+        built.append(build_target(target, pyramid, engine, reuse))
+        if PNG_LABEL.match(built[-1].encoding):
+            reuse = built[-1].encoding
+    return built
+
+
+def size_groups(targets):
+    """targets grouped by (kind, width, height), in first-seen order"""
+    groups = {}
+    for t in targets:
+        groups.setdefault((t.kind, t.width, t.height), []).append(t)
+    return list(groups.values())
+
+
+def _run(targets, jobs, pyramid, engine, params=None):
+    """Yield Built results as targets finish — in-process when jobs == 1.
+
+    Each worker task is one size group (see build_group). Workers re-apply
+    params themselves, since spawned processes start from the module
+    defaults rather than this process's overrides.
+    """
+    groups = size_groups(targets)
+    if jobs == 1 or len(groups) < 2:
+        for group in groups:
+            yield from build_group(group, pyramid, engine)
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(max_workers=min(jobs, len(groups)),
+                             initializer=apply_params if params else None,
+                             initargs=(params,) if params else ()) as pool:
+        futures = [pool.submit(build_group, group, pyramid, engine) for group in groups]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def _size(n):
+    return f'{n / KB:.0f} KB' if n < KB * KB else f'{n / (KB * KB):.1f} MB'
+
+
+def build(targets, jobs=None, pyramid=False, force=False, engine='pil', params=None):
+    """Fan stale targets out over a process pool and report per-target wall time.
+
+    Targets whose input key and output file are unchanged since the last
+    build are skipped without rendering. Returns the targets that came out
+    over their byte budget; those are neither written nor cached, so they
+    fail again on the next run.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    busy = 0.0
+
+    cache = {} if force else load_cache()
+    keys = {t: input_key(t, pyramid, engine) for t in targets}
+    stale = [t for t in targets if not is_fresh(cache, t, keys[t])]
+    for target in targets:
+        if target not in stale:
+            print(f'  ⏭  {target.path} (cached)')
+
+    failed = []
+    for built in _run(stale, jobs, pyramid, engine, params):
+        target = built.target
+        busy += built.seconds
+        if over_budget(target, built.size):
+            failed.append(built)
+            cache.pop(target.path, None)
+            status, note = '❌', ' — over budget, not written'
+        else:
+            cache[target.path] = {'key': keys[target],
+                                  'stamps': [_stamp(p) for p in output_paths(target)]}
+            status = '✅' if built.written else '🟰'
+            note = '' if built.written else ' — pixels unchanged, not rewritten'
+        budget = f'/{target.budget / KB:.0f}' if target.budget else ''
+        how = 'sdf' if engine == 'sdf' and target.kind in EMBLEMS else f'{target.samples}x'
+        print(f'  {status} {target.path} ({target.width}x{target.height}) '
+              f'{built.size / KB:.1f}{budget} KB [{built.encoding}] {built.seconds * 1000:.0f} ms '
+              f'(render {built.render_seconds * 1000:.0f} ms @{how}, '
+              f'peak {_size(built.peak_bytes)}){note}')
+        for path, size, encoding in built.extras:
+            print(f'     ↳ {path} {size / KB:.1f} KB [{encoding}] '
+                  f'{(size - built.size) / built.size:+.0%} vs PNG')
+
+    if stale:
+        save_cache(cache)
+    wall = time.perf_counter() - start
+    print(f'\n⏱  {len(stale)}/{len(targets)} targets rebuilt in {wall:.2f}s on {jobs} worker(s) '
+          f'({busy:.2f}s of render time, {busy / wall if wall else 0:.1f}x)')
+    return failed
+
+
+# ─── Parameters file + watch mode ───
+# The palette, emblem proportions and target list can be overridden from a
+# JSON file. --watch keeps this process (fonts, text masks) warm and
+# re-renders only the targets a save actually affects.
+
+PARAMS_FILE = '.icon-cache/icon-params.json'
+CONTACT_SHEET = '.icon-cache/contact-sheet.png'
+WATCH_INTERVAL = 0.05       # seconds between polls of the parameters file
+SHEET_CELL = 256
+SHEET_COLUMNS = 4
+
+PALETTE = ('ORANGE', 'DARK_BG', 'WHITE', 'LIGHT_ORANGE')
+LIGHT_BG = SPLASH_THEMES['light'][0]
+# apply_params starts over from these, so a key deleted from the file reverts
+DEFAULT_PALETTE = {name: globals()[name] for name in PALETTE}
+DEFAULT_EMBLEMS = dict(EMBLEMS)
+PARAMS_KEYS = ('colors', 'emblems', 'targets')
+# Emblem proportions are fractions of the icon: a circle radius, a cart size
+EMBLEM_RANGES = {'circle': (0.05, 0.5), 'cart': (0.05, 1.0)}
+
+
+def current_params():
+    """The parameters in effect, in the shape a parameters file uses"""
+    return {
+        'colors': {name.lower(): list(globals()[name]) for name in PALETTE},
+        'emblems': {kind: {'circle': circle, 'cart': cart}
+                    for kind, (_, circle, cart) in EMBLEMS.items()},
+        'targets': [t.name for t in TARGETS],
+    }
+
+
+def _check_keys(field, obj, allowed):
+    if not isinstance(obj, dict):
+        raise ValueError(f'{field}: expected an object, got {json.dumps(obj)}')
+    unknown = [key for key in obj if key not in allowed]
+    if unknown:
+        raise ValueError(f'{field}: unknown key(s) {", ".join(map(repr, unknown))} '
+                         f'(expected {", ".join(allowed)})')
+
+
+def check_params(params):
+    """Raise ValueError naming the first field of params that apply_params can't use"""
+    _check_keys('parameters', params, PARAMS_KEYS)
+    colors = params.get('colors', {})
+    _check_keys('colors', colors, [name.lower() for name in PALETTE])
+    for name, value in colors.items():
+        if not (isinstance(value, list) and len(value) == 3
+                and all(isinstance(c, int) and not isinstance(c, bool) and 0 <= c <= 255 for c in value)):
+            raise ValueError(f'colors.{name}: expected [r, g, b] with values 0-255, got {json.dumps(value)}')
+    emblems = params.get('emblems', {})
+    _check_keys('emblems', emblems, list(EMBLEMS))
+    for kind, proportions in emblems.items():
+        _check_keys(f'emblems.{kind}', proportions, list(EMBLEM_RANGES))
+        for key, value in proportions.items():
+            low, high = EMBLEM_RANGES[key]
+            if not (isinstance(value, (int, float)) and not isinstance(value, bool) and low <= value <= high):
+                raise ValueError(f'emblems.{kind}.{key}: expected a number from {low} to {high}, '
+                                 f'got {json.dumps(value)}')
+    targets = params.get('targets', [])
+    if not (isinstance(targets, list) and all(isinstance(name, str) for name in targets)):
+        raise ValueError(f'targets: expected a list of target names, got {json.dumps(targets)}')
+    unknown = [name for name in targets if name not in {t.name for t in TARGETS}]
+    if unknown:
+        raise ValueError(f'targets: unknown target(s): {", ".join(unknown)}')
+
+
+def load_params(path):
+    with open(path) as f:
+        try:
+            params = json.load(f)
+        except ValueError as e:
+            raise ValueError(f'{path}: not valid JSON ({e})') from None
+    try:
+        check_params(params)
+    except ValueError as e:
+        raise ValueError(f'{path}: {e}') from None
+    return params
+
+
+def apply_params(params):
+    """Set the palette and emblem proportions to the defaults overlaid with params.
+
+    Keys params leaves out take their default value, not whatever an
+    earlier call set. params must have passed check_params.
+    """
+    globals().update(DEFAULT_PALETTE)
+    EMBLEMS.update(DEFAULT_EMBLEMS)
+    for name, value in params.get('colors', {}).items():
+        globals()[name.upper()] = tuple(value)
+    for kind, proportions in params.get('emblems', {}).items():
+        background, circle, cart = EMBLEMS[kind]
+        EMBLEMS[kind] = (background, proportions.get('circle', circle), proportions.get('cart', cart))
+    # Tables that captured the palette when the module loaded
+    EMBLEMS['icon'] = (DARK_BG,) + EMBLEMS['icon'][1:]
+    SPLASH_THEMES['dark'] = (DARK_BG, WHITE, LIGHT_ORANGE)
+    SPLASH_THEMES['light'] = (LIGHT_BG, DARK_BG, ORANGE)
+
+
+def selected_targets(params):
+    names = params.get('targets')
+    return [t for t in TARGETS if names is None or t.name in names]
+
+
+def target_fingerprint(target):
+    """Everything in the parameters file that can change this target's pixels"""
+    return (target, ORANGE, DARK_BG, WHITE, LIGHT_ORANGE,
+            EMBLEMS.get(target.kind), SPLASH_THEMES[target.theme])
+
+
+def contact_sheet(thumbs, cell=SHEET_CELL, columns=SHEET_COLUMNS):
+    """Grid of labelled thumbnails on a mid-grey, so both light and dark art shows"""
+    from PIL import Image, ImageDraw
+    label_px = 14
+    rows = max(1, -(-len(thumbs) // columns))
+    sheet = Image.new('RGBA', (columns * cell, rows * (cell + label_px * 2)), (96, 96, 96, 255))
+    draw = ImageDraw.Draw(sheet)
+    font = load_font('semibold', label_px)
+    for i, (label, thumb) in enumerate(thumbs):
+        x, y = (i % columns) * cell, (i // columns) * (cell + label_px * 2)
+        sheet.alpha_composite(thumb, (x + (cell - thumb.width) // 2, y + (cell - thumb.height) // 2))
+        draw.text((x + cell // 2, y + cell + label_px // 2), label, fill=WHITE, font=font, anchor='mt')
+    return sheet
+
+
+def preview_target(target, cell=SHEET_CELL):
+    """target scaled down to fit a contact-sheet cell — the drawing code is
+    resolution independent, so this is the same design for a fraction of the work"""
+    scale = min(1, (cell - 16) / max(target.width, target.height))
+    return target._replace(width=max(1, round(target.width * scale)),
+                           height=max(1, round(target.height * scale)))
+
+
+def watch(path=PARAMS_FILE, sheet_path=CONTACT_SHEET, samples=None, engine='pil'):
+    """Re-render affected targets and the contact sheet whenever path is saved.
+
+    Previews are rendered at thumbnail size and never written under assets/
+    or public/; run a normal build with --params once the sheet looks right.
+    """
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(_json(current_params()))
+        print(f'  ✅ {path} created from the current defaults')
+    print(f'👀 Watching {path} → {sheet_path} (Ctrl-C to stop)\n')
+
+    thumbs, prints = {}, {}
+    last = None
+    try:
+        while True:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                mtime = None
+            if mtime is None or mtime == last:
+                time.sleep(WATCH_INTERVAL)
+                continue
+            last = mtime
+            start = time.perf_counter()
+            try:
+                params = load_params(path)
+                palette = (ORANGE, DARK_BG, WHITE, LIGHT_ORANGE)
+                apply_params(params)
+            except (OSError, ValueError) as e:
+                print(f'  ⚠️  {e} — keeping the last good preview')
+                continue
+            if palette != (ORANGE, DARK_BG, WHITE, LIGHT_ORANGE):
+                emblem_layer.cache_clear()      # colored; text masks are not
+            _pyramids.clear()
+
+            targets = selected_targets(params)
+            if samples:
+                targets = [t._replace(samples=samples) for t in targets]
+            changed = [t for t in targets if prints.get(t.name) != target_fingerprint(t)]
+            for target in changed:
+                img = render_target(preview_target(target), engine=engine).convert('RGBA')
+                thumbs[target.name] = (f'{target.name} {target.width}x{target.height}', img)
+                prints[target.name] = target_fingerprint(target)
+            for name in set(thumbs) - {t.name for t in targets}:
+                del thumbs[name], prints[name]
+
+            os.makedirs(os.path.dirname(sheet_path) or '.', exist_ok=True)
+            sheet = contact_sheet([thumbs[t.name] for t in targets])
+            sheet.convert('RGB').save(sheet_path, 'PNG', compress_level=1)     # speed over size
+            print(f'  🔄 {len(changed)}/{len(targets)} target(s) re-rendered, sheet written in '
+                  f'{(time.perf_counter() - start) * 1000:.0f} ms')
+    except KeyboardInterrupt:
+        print('\n👋 Stopped watching')
+
+
+# ─── Render service ───
+# --serve renders any one size or variant on request, so you don't have to add it
+# to TARGETS and rebuild. Example: GET /render?kind=icon&size=300&format=webp.
+# Encoded results are kept in an in-memory LRU capped by bytes. Each one carries
+# an ETag, so a client repeating a request gets a 304 without a body.
+# GET /stats reports the cache and the cold and warm latencies.
+
+SERVE_HOST = '127.0.0.1'        # local only — there is no auth
+SERVE_PORT = 8765
+SERVE_CACHE_MB = 64
+SERVE_MAX_SIZE = 4096
+# Smallest size per kind that draws (the favicon's circle and the splash
+# text need a few pixels) — and below which nobody needs the art anyway
+SERVE_MIN_SIZE = {'icon': 16, 'adaptive': 16, 'favicon': 16, 'splash': 240}
+SERVE_SIZE = re.compile(r'^(\d+)(?:x(\d+))?$')
+SERVE_MAX_SAMPLES = 8
+SERVE_SAMPLES = 2
+SERVE_FORMATS = {'png': MIME_TYPES['.png'], 'webp': MIME_TYPES['.webp'], 'svg': MIME_TYPES['.svg']}
+SERVE_PARAMS = ('kind', 'size', 'theme', 'lang', 'format', 'samples', 'optimize')
+LATENCY_WINDOW = 1000           # most recent requests kept per latency bucket
+
+
+def _serve_int(query, name, default, low, high):
+    value = query.get(name, default)
+    try:
+        value = int(value)
+    except ValueError:
+        raise ValueError(f'{name} must be a whole number, got {value!r}') from None
+    if not low <= value <= high:
+        raise ValueError(f'{name} must be between {low} and {high}, got {value}')
+    return value
+
+
+def serve_query(text):
+    """Parameters of a query string as a dict — ValueError if one is repeated"""
+    pairs = urllib.parse.parse_qsl(text, keep_blank_values=True)
+    seen, repeated = set(), []
+    for name, _ in pairs:
+        if name in seen and name not in repeated:
+            repeated.append(name)
+        seen.add(name)
+    if repeated:
+        raise ValueError(f'parameter(s) given more than once: {", ".join(repeated)}')
+    return dict(pairs)
+
+
+def etag_matches(header, etag):
+    """If-None-Match against etag by weak comparison (RFC 9110 13.1.2):
+    W/ prefixes are ignored and * matches any current representation"""
+    tags = [tag.strip().removeprefix('W/') for tag in header.split(',')]
+    return '*' in tags or etag.removeprefix('W/') in tags
+
+
+def serve_request(query):
+    """(target, format, optimize) for a /render query — ValueError on bad input.
+
+    Parameters that cannot change the output (a splash theme on an icon,
+    samples for an SVG) fall back to their defaults, so variants that render
+    the same pixels share one cache entry.
+    """
+    unknown = sorted(set(query) - set(SERVE_PARAMS))
+    if unknown:
+        raise ValueError(f'unknown parameter(s): {", ".join(unknown)} (expected {", ".join(SERVE_PARAMS)})')
+    kind = query.get('kind', 'icon')
+    if kind not in DESIGNS:
+        raise ValueError(f'kind must be one of {", ".join(DESIGNS)}, got {kind!r}')
+    fmt = query.get('format', 'png')
+    if fmt not in SERVE_FORMATS:
+        raise ValueError(f'format must be one of {", ".join(SERVE_FORMATS)}, got {fmt!r}')
+    if fmt == 'svg' and kind not in EMBLEMS:
+        raise ValueError(f'format svg is only drawn for {", ".join(EMBLEMS)}')
+    theme, lang = query.get('theme', 'dark'), query.get('lang', 'en')
+    if theme not in SPLASH_THEMES:
+        raise ValueError(f'theme must be one of {", ".join(SPLASH_THEMES)}, got {theme!r}')
+    if lang not in SPLASH_TAGLINES:
+        raise ValueError(f'lang must be one of {", ".join(SPLASH_TAGLINES)}, got {lang!r}')
+
+    # size is N (square) or WxH; splash defaults to its master, the rest to the SVG viewBox
+    _, master_w, master_h = DESIGNS[kind]
+    size = query.get('size', f'{master_w}x{master_h}' if kind == 'splash' else str(SVG_SIZE))
+    m = SERVE_SIZE.match(size)
+    if not m:
+        raise ValueError(f'size must be N or WxH in pixels, got {size!r}')
+    low = SERVE_MIN_SIZE[kind]
+    width = _serve_int({'size': m.group(1)}, 'size', None, low, SERVE_MAX_SIZE)
+    height = _serve_int({'size': m.group(2)}, 'size', None, low, SERVE_MAX_SIZE) if m.group(2) else width
+    if width != height and (kind != 'splash' or fmt == 'svg'):
+        raise ValueError(f'{kind} is square — pass size=N')
+
+    samples = _serve_int(query, 'samples', SERVE_SAMPLES, 1, SERVE_MAX_SAMPLES)
+    optimize = _serve_int(query, 'optimize', 0, 0, 1)
+    if kind != 'splash':
+        theme, lang = 'dark', 'en'
+    if kind == 'favicon' or fmt == 'svg':
+        samples = 1
+    if fmt == 'svg':
+        optimize = 0
+    target = Target('serve', kind, width, height, f'serve.{fmt}', samples=samples, theme=theme, lang=lang)
+    return target, fmt, bool(optimize)
+
+
+def encode_served(target, fmt, optimize, pyramid=False, engine='pil'):
+    """Encoded bytes for one /render request.
+
+    By default the encoders are single-pass (zlib PNG, lossless WebP), so
+    a cold response takes about as long as the render. optimize=1 runs the
+    build's own search for the smallest PNG or WebP, which can take
+    seconds at large sizes.
+    """
+    if fmt == 'svg':
+        return render_svg(target.kind, target.width).encode()
+    _, master_w, master_h = DESIGNS[target.kind]
+    pyramid = pyramid and target.width <= master_w and target.height <= master_h
+    img = render_target(target, pyramid, engine)
+    if optimize:
+        return (optimize_png if fmt == 'png' else optimize_webp)(img)[0]
+    return encode_image(img, 'PNG') if fmt == 'png' else encode_image(img, 'WEBP', lossless=True)
+
+
+class RenderCache:
+    """Encoded renders, least recently used evicted first once over max_bytes.
+
+    Entries are (data, etag, content type). Handler threads share one cache.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        size = len(entry[0])
+        if size > self.max_bytes:
+            return      # would evict everything and still not fit
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.bytes -= len(old[0])
+            self.entries[key] = entry
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (data, _, _) = self.entries.popitem(last=False)
+                self.bytes -= len(data)
+                self.evictions += 1
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {'entries': len(self.entries), 'bytes': self.bytes, 'max_bytes': self.max_bytes,
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'hit_rate': round(self.hits / lookups, 3) if lookups else None}
+
+
+def latency_summary(count, window):
+    """Milliseconds over the most recent requests in window (count is all-time)"""
+    if not window:
+        return {'count': count}
+    ordered = sorted(window)
+
+    def ms(seconds):
+        return round(seconds * 1000, 3)
+    return {'count': count, 'mean_ms': ms(sum(ordered) / len(ordered)),
+            'p50_ms': ms(ordered[len(ordered) // 2]),
+            'p95_ms': ms(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]),
+            'max_ms': ms(ordered[-1])}
+
+
+class RenderService:
+    """The render cache plus per-bucket latencies. The buckets are:
+
+    - cold: rendered for this request
+    - coalesced: waited on an identical request's render already in flight
+    - warm: served from the cache
+    - not_modified: 304 on a matching ETag
+    """
+
+    BUCKETS = ('cold', 'coalesced', 'warm', 'not_modified')
+
+    def __init__(self, cache_bytes, pyramid=False, engine='pil'):
+        self.cache = RenderCache(cache_bytes)
+        self.pyramid = pyramid
+        self.engine = engine
+        self.started = time.perf_counter()
+        self.counts = dict.fromkeys(self.BUCKETS, 0)
+        self.windows = {bucket: deque(maxlen=LATENCY_WINDOW) for bucket in self.BUCKETS}
+        self.rendering = {}         # key -> Future of the entry, while one thread renders it
+        self.lock = threading.Lock()
+
+    def fetch(self, target, fmt, optimize):
+        """(data, etag, content type, bucket). On a cache miss, renders the entry.
+
+        Only one thread renders a given key at a time. Identical requests that
+        arrive during the render wait for its result.
+        """
+        # The fingerprint covers the palette and proportions, so a --params
+        # file applied at start-up never serves stale pixels
+        from concurrent.futures import Future
+        key = (target_fingerprint(target), fmt, optimize)
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                return (*entry, 'warm')
+            future = self.rendering.get(key)
+            owner = future is None
+            if owner:
+                future = self.rendering[key] = Future()
+        if not owner:
+            return (*future.result(), 'coalesced')
+
+        try:
+            data = encode_served(target, fmt, optimize, self.pyramid, self.engine)
+            entry = (data, f'"{hashlib.sha256(data).hexdigest()[:20]}"', SERVE_FORMATS[fmt])
+            self.cache.put(key, entry)
+            future.set_result(entry)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                del self.rendering[key]
+        return (*entry, 'cold')
+
+    def record(self, bucket, seconds):
+        with self.lock:
+            self.counts[bucket] += 1
+            self.windows[bucket].append(seconds)
+
+    def stats(self):
+        with self.lock:
+            latency = {bucket: latency_summary(self.counts[bucket], self.windows[bucket])
+                       for bucket in self.BUCKETS}
+        return {'uptime_s': round(time.perf_counter() - self.started, 1), 'engine': self.engine,
+                'pyramid': self.pyramid, 'cache': self.cache.stats(), 'latency': latency}
+
+
+class RenderHandler:
+    """GET or HEAD /render?<SERVE_PARAMS> and /stats; the server carries the RenderService.
+
+    A mixin: make_server() combines it with http.server's
+    BaseHTTPRequestHandler, so only --serve imports http.server.
+    """
+
+    server_version = 'oja-icons'
+    head = False        # HEAD: same status and headers as GET, no body
+
+    def do_HEAD(self):
+        self.head = True
+        self.do_GET()
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        if url.path == '/stats':
+            return self.send_json(self.server.service.stats())
+        if url.path != '/render':
+            return self.send_json({'error': f'no such endpoint {url.path}',
+                                   'endpoints': ['/render?' + '&'.join(f'{p}=' for p in SERVE_PARAMS),
+                                                 '/stats']}, 404)
+        start = time.perf_counter()
+        try:
+            target, fmt, optimize = serve_request(serve_query(url.query))
+        except ValueError as e:
+            return self.send_json({'error': str(e)}, 400)
+        try:
+            data, etag, content_type, bucket = self.server.service.fetch(target, fmt, optimize)
+        except Exception as e:
+            # Input was valid, so this is a renderer bug: answer rather than drop the connection
+            print(f'  ❌ {self.path}: {type(e).__name__}: {e}')
+            return self.send_json({'error': f'render failed: {type(e).__name__}: {e}'}, 500)
+
+        matches = etag_matches(self.headers.get('If-None-Match', ''), etag)
+        if matches:
+            bucket = 'not_modified'
+        self.send_response(304 if matches else 200)
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')       # revalidate, so --params edits show
+        if not matches:
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if not matches and not self.head:
+            self.wfile.write(data)
+        seconds = time.perf_counter() - start
+        self.server.service.record(bucket, seconds)
+        print(f'  {"🟰" if matches else "✅"} {target.kind} {target.width}x{target.height} {fmt} '
+              f'{len(data) / KB:.1f} KB {seconds * 1000:.1f} ms ({bucket.replace("_", " ")})')
+
+    def send_json(self, obj, status=200):
+        data = _json(obj).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if not self.head:
+            self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass        # do_GET prints its own one-line summary
+
+
+def make_server(port=SERVE_PORT, cache_bytes=SERVE_CACHE_MB * KB * KB, pyramid=False, engine='pil'):
+    """A threading HTTP server on localhost carrying a fresh RenderService (port 0 picks one)"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    handler = type('RenderHandler', (RenderHandler, BaseHTTPRequestHandler), {})
+    server = ThreadingHTTPServer((SERVE_HOST, port), handler)
+    server.service = RenderService(cache_bytes, pyramid, engine)
+    return server
+
+
+def serve(port=SERVE_PORT, cache_bytes=SERVE_CACHE_MB * KB * KB, pyramid=False, engine='pil'):
+    """Serve /render and /stats on localhost until Ctrl-C"""
+    server = make_server(port, cache_bytes, pyramid, engine)
+    base = f'http://{SERVE_HOST}:{server.server_port}'
+    print(f'🌐 Serving {base}/render?kind=icon&size=512 and {base}/stats '
+          f'({cache_bytes / (KB * KB):.3g} MB cache, Ctrl-C to stop)\n')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print('\n👋 Stopped serving')
+    finally:
+        server.server_close()
 
 
 # ─── Generate ───
-print('🎨 Generating Oja POS icons v2 (bigger cart, cleaner favicon)...\n')
 
-generate_icon(1024, 'assets/icon.png')
-generate_adaptive_icon(1024, 'assets/adaptive-icon.png')
-generate_favicon(48, 'assets/favicon.png')
-generate_icon(512, 'assets/splash-icon.png')
-generate_splash(1284, 2778, 'assets/splash-full.png')
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate Oja POS icons and splash screens')
+    parser.add_argument('targets', nargs='*', help='target names to build (default: all)')
+    parser.add_argument('--pyramid', action='store_true',
+                        help='derive every size from one master render per design')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: CPU count)')
+    parser.add_argument('--splash-matrix', action='store_true',
+                        help='also build every device x theme x language splash into assets/splash/')
+    parser.add_argument('--theme', action='append', choices=sorted(SPLASH_THEMES),
+                        help='limit the splash matrix to this theme (repeatable)')
+    parser.add_argument('--lang', action='append', choices=sorted(SPLASH_TAGLINES),
+                        help='limit the splash matrix to this language (repeatable)')
+    parser.add_argument('--engine', choices=ENGINES, default='pil',
+                        help='rasterizer for the circle + cart icons (sdf needs numpy)')
+    parser.add_argument('--samples', type=int, default=None,
+                        help='override every target\'s supersampling factor')
+    parser.add_argument('--web-manifest', action='store_true',
+                        help=f'regenerate the {WEB_MANIFEST} icons, {ASSET_MANIFEST} and the '
+                             f'{SERVICE_WORKER} precache list from the outputs on disk')
+    parser.add_argument('--force', action='store_true',
+                        help=f'ignore the build cache in {CACHE_FILE} and re-render everything')
+    parser.add_argument('--params', metavar='FILE',
+                        help='JSON file overriding colors, emblem proportions and the target list')
+    parser.add_argument('--watch', action='store_true',
+                        help=f'keep running, re-render what a save of the parameters file '
+                             f'(default {PARAMS_FILE}) affects and write {CONTACT_SHEET}')
+    parser.add_argument('--serve', type=int, nargs='?', const=SERVE_PORT, metavar='PORT',
+                        help=f'serve /render?kind=&size=&theme=&format=... and /stats on '
+                             f'{SERVE_HOST} (default port {SERVE_PORT}) instead of building')
+    parser.add_argument('--cache-mb', type=float, default=SERVE_CACHE_MB,
+                        help=f'--serve render cache cap in MB (default {SERVE_CACHE_MB})')
+    parser.add_argument('--stdout', action='store_true',
+                        help='write the one selected target\'s primary output to stdout; '
+                             'no files, cache or manifests are touched')
+    args = parser.parse_args(argv)
+
+    if args.engine == 'sdf' and not have_numpy():
+        parser.error('--engine sdf needs numpy (pip install numpy)')
+    if args.watch:
+        return watch(args.params or PARAMS_FILE, samples=args.samples, engine=args.engine)
+    params = None
+    if args.params:
+        try:
+            params = load_params(args.params)
+            apply_params(params)
+        except (OSError, ValueError) as e:
+            parser.error(f'--params: {e}')
+    if args.serve is not None:
+        return serve(args.serve, int(args.cache_mb * KB * KB), args.pyramid, args.engine)
+
+    # The manifest is every target, so --web-manifest always sees the full set;
+    # a parameters file's target list only narrows what gets built
+    matrix = splash_matrix(args.theme, args.lang) if args.splash_matrix else []
+    manifest = list(TARGETS) + matrix
+
+    names = {t.name for t in manifest}
+    unknown = [n for n in args.targets if n not in names]
+    if unknown:
+        parser.error(f'unknown target(s): {", ".join(unknown)}')
+    if args.targets:
+        targets = [t for t in manifest if t.name in args.targets]
+    else:
+        targets = selected_targets(params) + matrix if params else manifest
+    if args.samples:
+        targets = [t._replace(samples=args.samples) for t in targets]
+    if args.stdout:
+        if len(targets) != 1:
+            parser.error(f'--stdout needs exactly one target (got {len(targets)})')
+        outputs, _ = encode_target(targets[0], args.pyramid, args.engine)
+        sys.stdout.buffer.write(outputs[0][1])
+        return
+
+    mode = 'from masters (resampling pyramid)' if args.pyramid else '(bigger cart, cleaner favicon)'
+    print(f'🎨 Generating Oja POS icons v2 {mode}...\n')
+    over_budget = build(targets, jobs=args.jobs, pyramid=args.pyramid, force=args.force,
+                        engine=args.engine, params=params)
+    if over_budget:
+        for built in over_budget:
+            print(f'❌ {built.target.path} is {built.size:,} bytes, '
+                  f'over its {built.target.budget:,} byte budget')
+        raise SystemExit(1)
+    if args.web_manifest:
+        for path in update_web(manifest):
+            print(f'  ✅ {path} updated')
+    print('\n✅ All icons generated!')
+
 
-print('\n✅ All icons generated!')
+if __name__ == '__main__':
+    main()
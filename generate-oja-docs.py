@@ -1,146 +1,1127 @@
 #!/usr/bin/env python3
 """
-Oja POS — Setup & Reference Guide (.docx generator)
-
-Run:  python3 generate-oja-docs.py
-Out:  /Users/shile/Documents/Oja POS - Setup & Reference Guide.docx
+Oja POS — Setup & Reference Guide (.docx, Markdown, HTML and search index generator)
+
+Run:  python3 generate-oja-docs.py                 # all formats
+      python3 generate-oja-docs.py --format md     # just docs/setup-guide.md
+      python3 generate-oja-docs.py --merge shops.csv   # one setup sheet per shop, zipped
+      python3 generate-oja-docs.py --format docx --stdout > guide.docx   # reproducible bytes
+Out:  /Users/shile/Documents/Oja POS - Setup & Reference Guide.docx (+ .html)
+      docs/setup-guide.md, docs/search-index.json (offline help search) — both
+      committed, so rebuild and commit them with the sources they describe
 """
 
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor, Emu
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn
+# python-docx, lxml, zipfile, inspect and the process pool are imported by the
+# functions that use them, so --help and the cached paths never load them
+from collections import namedtuple
+import argparse
+import base64
+import contextlib
+import csv
+import glob
+import hashlib
+import html
+import io
+import json
 import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import unicodedata
 
 OUTPUT = os.path.expanduser("~/Documents/Oja POS - Setup & Reference Guide.docx")
-BRAND = RGBColor(0xE0, 0x5E, 0x1B)  # Burnt Orange
-GRAY = RGBColor(0x66, 0x66, 0x66)
+BRAND = 'E05E1B'  # Burnt Orange
+GRAY = '666666'
 LAST_UPDATED = "February 01, 2026"
 VERSION = "1.0"
 
-# ── helpers ──────────────────────────────────────────────────────────────────
-
-def set_cell_shading(cell, color_hex):
-    """Apply background shading to a table cell."""
-    shading = cell._element.get_or_add_tcPr()
-    sh = shading.makeelement(qn('w:shd'), {
-        qn('w:val'): 'clear',
-        qn('w:color'): 'auto',
-        qn('w:fill'): color_hex,
-    })
-    shading.append(sh)
-
-
-def add_table(doc, headers, rows, col_widths=None):
-    """Add a styled table with header row shading."""
-    t = doc.add_table(rows=1 + len(rows), cols=len(headers))
-    t.alignment = WD_TABLE_ALIGNMENT.LEFT
-    t.style = 'Table Grid'
-    # Header
-    for i, h in enumerate(headers):
-        cell = t.rows[0].cells[i]
-        cell.text = h
-        for p in cell.paragraphs:
-            for r in p.runs:
-                r.bold = True
-                r.font.size = Pt(10)
-        set_cell_shading(cell, 'F5E6D8')
-    # Data rows
-    for ri, row in enumerate(rows):
-        for ci, val in enumerate(row):
-            t.rows[ri + 1].cells[ci].text = val
-            for p in t.rows[ri + 1].cells[ci].paragraphs:
-                for r in p.runs:
-                    r.font.size = Pt(10)
-    if col_widths:
-        for ri_idx in range(len(t.rows)):
-            for ci_idx, w in enumerate(col_widths):
-                t.rows[ri_idx].cells[ci_idx].width = Inches(w)
-    doc.add_paragraph()  # spacer
-    return t
+# ── style registry ───────────────────────────────────────────────────────────
+# Formatting is defined once in the styles part; helpers and build() only
+# name a style, so document.xml carries no per-run font properties.
+# Values are plain data (hex colors, sizes in points, indents in inches)
+# that register_styles turns into python-docx units.
+
+BODY_FONT = 'Calibri'
+CODE_FONT = 'Courier New'
+GREEN = '227A22'
+AMBER = 'B45309'
+TABLE_STYLE = 'Oja Table'
+TABLE_HEADER_FILL = 'F5E6D8'
+TABLE_FONT_SIZE = 10     # pt
+
+# name -> (type, base style, font properties, paragraph format properties)
+STYLES = {
+    'Heading 1': ('paragraph', None, {'size': 14, 'color': BRAND}, {}),
+    'Heading 2': ('paragraph', None, {'size': 13, 'color': BRAND}, {}),
+    'Oja Title': ('paragraph', 'Normal', {'size': 36, 'bold': True, 'color': BRAND},
+                  {'alignment': 'center'}),
+    'Oja Subtitle': ('paragraph', 'Normal', {'size': 16, 'color': GRAY}, {'alignment': 'center'}),
+    'Oja Title Meta': ('paragraph', 'Normal', {'size': 12}, {'alignment': 'center'}),
+    'Oja Code': ('paragraph', 'Normal', {'name': CODE_FONT, 'size': 9}, {}),
+    'Oja Caption': ('paragraph', 'Normal', {'size': 9, 'color': GRAY}, {}),
+    # Status callouts
+    'Oja Note': ('paragraph', 'Normal', {}, {'left_indent': 0.2}),
+    'Oja Success': ('paragraph', 'Normal', {'bold': True, 'color': GREEN}, {}),
+    'Oja Warning': ('paragraph', 'Normal', {'bold': True, 'color': AMBER}, {}),
+    'Oja Strong': ('character', None, {'bold': True}, {}),
+}
+
+CALLOUTS = {'note': 'Oja Note', 'success': 'Oja Success', 'warning': 'Oja Warning'}
+
+
+def _table_style_xml():
+    """Brand table: Table Grid borders, 10 pt text, shaded bold header row.
+
+    python-docx has no API for conditional (firstRow) table formatting, so
+    this one is written as XML. Cell text takes its size from here because
+    Normal leaves the size to the document defaults.
+    """
+    from docx.oxml.ns import nsdecls
+    size = TABLE_FONT_SIZE * 2
+    return (f'<w:style {nsdecls("w")} w:type="table" w:customStyle="1" '
+            f'w:styleId="{TABLE_STYLE.replace(" ", "")}">'
+            f'<w:name w:val="{TABLE_STYLE}"/><w:basedOn w:val="TableGrid"/><w:uiPriority w:val="59"/>'
+            f'<w:rPr><w:sz w:val="{size}"/><w:szCs w:val="{size}"/></w:rPr>'
+            '<w:tblStylePr w:type="firstRow"><w:rPr><w:b/><w:bCs/></w:rPr>'
+            f'<w:tcPr><w:shd w:val="clear" w:color="auto" w:fill="{TABLE_HEADER_FILL}"/></w:tcPr>'
+            '</w:tblStylePr></w:style>')
+
+
+def register_styles(doc):
+    """Define the brand styles in doc's styles part (idempotent)"""
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import qn
+    from docx.shared import Inches, Pt, RGBColor
+    styles = doc.styles
+    # Body font lives in the document defaults rather than on Normal, so
+    # table and paragraph styles can still set their own size
+    fonts = styles.element.find(qn('w:docDefaults')).find(qn('w:rPrDefault')).find(qn('w:rPr'))
+    rfonts = fonts.find(qn('w:rFonts'))
+    for attr in ('w:asciiTheme', 'w:hAnsiTheme'):
+        rfonts.attrib.pop(qn(attr), None)
+    rfonts.set(qn('w:ascii'), BODY_FONT)
+    rfonts.set(qn('w:hAnsi'), BODY_FONT)
+
+    for name, (kind, base, font, paragraph) in STYLES.items():
+        style = styles[name] if name in styles else styles.add_style(name, WD_STYLE_TYPE[kind.upper()])
+        if base:
+            style.base_style = styles[base]
+        for attr, value in font.items():
+            if attr == 'color':
+                style.font.color.rgb = RGBColor.from_string(value)
+            else:
+                setattr(style.font, attr, Pt(value) if attr == 'size' else value)
+        for attr, value in paragraph.items():
+            if attr == 'alignment':
+                value = WD_ALIGN_PARAGRAPH[value.upper()]
+            elif attr == 'left_indent':
+                value = Inches(value)
+            setattr(style.paragraph_format, attr, value)
+
+    if TABLE_STYLE not in styles:
+        styles.element.append(parse_xml(_table_style_xml()))
+    return doc
+
+
+def new_document():
+    """A blank python-docx document with the brand styles registered"""
+    from docx import Document
+    return register_styles(Document())
+
+
+# ── repo sources ─────────────────────────────────────────────────────────────
+# Reference sections are generated from the code itself so they cannot drift.
+# Parsed results are cached by file hash in SOURCE_CACHE; a source is only
+# re-parsed when its bytes (or this script) change.
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE_CACHE = os.path.join(ROOT, '.docs-cache', 'sources.json')
+
+# setup-db.sql first, then migrations in order; the first definition of a name wins
+SCHEMA_SOURCES = ['scripts/setup-db.sql', 'supabase/migrations/*.sql']
+I18N_DIR = 'src/i18n'
+MODULE_DIRS = ['src/lib', 'src/store']
+
+# Hand-written purpose lines; modules without one fall back to their header comment
+MODULE_NOTES = {
+    'src/lib/storage.ts': 'Platform-specific storage adapter (MMKV native, localStorage web)',
+    'src/lib/syncService.ts': 'Cloud sync logic (Supabase ↔ local, 5-min interval)',
+    'src/lib/paystack.ts': 'Paystack client (initializePayment, verifyPayment)',
+    'src/lib/activationCode.ts': 'HMAC-SHA256 code generation + validation',
+    'src/lib/premiumFeatures.ts': 'Feature access map + canAccess() helper',
+    'src/lib/lowStockAlerts.ts': 'WhatsApp inventory alert system',
+    'src/lib/printerService.ts': 'Bluetooth thermal printer + web print fallback',
+    'src/lib/businessTemplates.ts': 'Starter product catalogs per business type (onboarding)',
+    'src/lib/catalogGenerator.ts': 'Shareable WhatsApp catalog link + message',
+    'src/lib/placeholderConfig.ts': 'Per-business-type placeholder text for forms',
+    'src/lib/receiptPdf.ts': 'Sale and payment receipts as shareable PDFs',
+    'src/lib/supabase.ts': 'Supabase client (anon key, session persisted via storage.ts)',
+    'src/store/retailStore.ts': 'Products, sales, customers, expenses and stock movements',
+    'src/store/staffStore.ts': 'Staff members, roles and PIN activity log',
+    'src/store/subscriptionStore.ts': 'Tier management (starter/business)',
+    'src/store/onboardingStore.ts': 'Shop profile + onboarding progress',
+    'src/store/payrollStore.ts': 'Staff salaries and payment records',
+}
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class SourceCache:
+    """Parsed repo sources, keyed by parser + path and validated by content hash."""
+
+    def __init__(self, path=None):
+        self.path = path or SOURCE_CACHE
+        self.hits = self.misses = 0
+        with open(os.path.abspath(__file__), 'rb') as f:
+            self.script = _digest(f.read())
+        try:
+            with open(self.path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def parse(self, parser, rel_path):
+        with open(os.path.join(ROOT, rel_path), 'rb') as f:
+            data = f.read()
+        key = f'{parser.__name__}:{rel_path}'
+        digest = _digest(data)
+        entry = self.entries.get(key)
+        if entry and entry['sha256'] == digest and entry['script'] == self.script:
+            self.hits += 1
+            return entry['result']
+        self.misses += 1
+        result = parser(data.decode('utf-8'))
+        self.entries[key] = {'sha256': digest, 'script': self.script, 'result': result}
+        return result
+
+    def save(self):
+        if not self.misses:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump(self.entries, f, indent=1, ensure_ascii=False)     # results keep their order
+
+
+def repo_files(*patterns):
+    """Repo-relative paths matching the glob patterns, in pattern then name order"""
+    paths = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(os.path.join(ROOT, pattern))):
+            rel = os.path.relpath(path, ROOT).replace(os.sep, '/')
+            if rel not in paths:
+                paths.append(rel)
+    return paths
+
+
+# comment is the block of -- lines directly above (blank lines between are allowed)
+SQL_TABLE = re.compile(r'(?P<comment>(?:^--[^\n]*\n)+)?(?:^[ \t]*\n)*^create table (?:if not exists )?'
+                       r'(?:public\.)?(?P<name>\w+)\s*\((?P<body>.*?)\n\);', re.I | re.M | re.S)
+SQL_INDEX = re.compile(r'^create (?P<unique>unique )?index (?:if not exists )?(?P<name>\w+) '
+                       r'on (?:public\.)?(?P<table>\w+)\s*(?:using \w+\s*)?\((?P<columns>[^)]*)\)', re.I | re.M)
+SQL_RLS = re.compile(r'^alter table (?:public\.)?(\w+) enable row level security', re.I | re.M)
+SQL_CONSTRAINTS = ('primary', 'unique', 'constraint', 'check', 'foreign')
+
+
+def sql_comment(block):
+    """One line from a block of -- comment lines. A line starting in lower
+    case continues the sentence above it; anything else is a new clause."""
+    text = ''
+    for line in (block or '').splitlines():
+        line = line.lstrip('-').strip()
+        if line:
+            text += (' ' if line[0].islower() else ' — ') + line if text else line
+    return text
+
+
+def parse_sql_schema(text):
+    """Tables (with their leading comment and columns), indexes and RLS from a SQL script"""
+    tables = []
+    for m in SQL_TABLE.finditer(text):
+        columns = []
+        for line in m.group('body').splitlines():
+            word = line.strip().split(' ', 1)[0].strip('",')
+            if word and not word.startswith('--') and word.lower() not in SQL_CONSTRAINTS:
+                columns.append(word)
+        tables.append({'name': m.group('name'), 'comment': sql_comment(m.group('comment')),
+                       'columns': columns})
+    indexes = [{'name': m.group('name'), 'table': m.group('table'), 'unique': bool(m.group('unique')),
+                'columns': [c.strip() for c in m.group('columns').split(',')]}
+               for m in SQL_INDEX.finditer(text)]
+    return {'tables': tables, 'indexes': indexes, 'rls': SQL_RLS.findall(text)}
+
+
+TS_KEY = r"""(?P<key>\w+|'[^']*'|"[^"]*")\s*:\s*"""
+TS_OBJECT = re.compile(TS_KEY + r'\{\s*$')
+TS_ARRAY = re.compile(TS_KEY + r'\[')
+TS_STRING = re.compile(TS_KEY + r"""(?P<value>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`)""")
+
+
+def parse_i18n(text):
+    """{dot.path: string} for every leaf of a translation module's default export.
+
+    Arrays (e.g. rotating messages) count as one leaf holding their items joined.
+    """
+    leaves, stack, array = {}, [], None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('//'):
+            continue
+        if array is not None:
+            if line.startswith(']'):
+                leaves[array[0]] = '\n'.join(array[1])
+                array = None
+            else:
+                array[1].append(line.rstrip(',')[1:-1])
+            continue
+        m = TS_OBJECT.match(line) or TS_ARRAY.match(line) or TS_STRING.match(line)
+        if m:
+            path = '.'.join(stack + [m.group('key').strip('\'"')])
+            if m.re is TS_OBJECT:
+                stack.append(m.group('key').strip('\'"'))
+            elif m.re is TS_ARRAY:
+                array = (path, [])
+            else:
+                leaves[path] = m.group('value')[1:-1]
+        elif line.startswith('}') and stack:
+            stack.pop()
+    return leaves
+
+
+TS_LANGUAGE = re.compile(r"code:\s*'(?P<code>\w+)',\s*name:\s*'(?P<name>[^']+)'")
+
+
+def parse_languages(text):
+    """[code, name] pairs in the order of LANGUAGES in src/i18n/index.ts"""
+    return [[m.group('code'), m.group('name')] for m in TS_LANGUAGE.finditer(text)]
+
+
+TS_EXPORT = re.compile(r'^export\s+(?:default\s+)?(?:async\s+)?'
+                       r'(?:function\*?|const|let|class|interface|type|enum)\s+(\w+)', re.M)
+TS_REEXPORT = re.compile(r'^export\s*\{([^}]*)\}', re.M)
+
+
+def comment_lines(first, lines):
+    """Text of each line of the comment that opens on first (then continues
+    from lines), with the comment markers taken off"""
+    block = first.startswith('/*')
+    line = first
+    while line is not None:
+        line = line.strip()
+        if block:
+            yield line.split('*/')[0].lstrip('/*!').strip()
+            if '*/' in line:
+                return
+        elif line.startswith('//'):
+            yield line.lstrip('/!').strip()
+        else:
+            return
+        line = next(lines, None)
+
+
+def parse_module(text):
+    """A module's exported names and the first sentence of its header comment.
+
+    The header is a comment that opens the file, before or just after the
+    imports — comments further down describe code, not the module. Its
+    lines are joined until a blank line, a full stop, or a line that opens
+    with a capital (a new sentence).
+    """
+    summary = ''
+    lines = iter(text.splitlines())
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith(('import ', "'use ", '"use ')):
+            continue
+        if line.startswith(('//', '/*')):
+            for part in comment_lines(line, lines):
+                if not part:
+                    if summary:
+                        break
+                elif not summary:
+                    summary = part
+                elif summary.endswith(('.', '!', '?')) or part[0].isupper():
+                    break
+                else:
+                    summary += ' ' + part
+            summary = summary.rstrip('.')
+            if ' ' not in summary:
+                summary = ''        # a section divider such as "// Types"
+        break
+    exports = TS_EXPORT.findall(text)
+    for names in TS_REEXPORT.findall(text):
+        exports += [n.split(' as ')[-1].strip() for n in names.split(',') if n.strip()]
+    return {'summary': summary, 'exports': exports}
+
+
+def repo_schema(cache):
+    """Merged schema: tables and indexes across SCHEMA_SOURCES, first definition wins"""
+    tables, indexes, rls = {}, {}, set()
+    for path in repo_files(*SCHEMA_SOURCES):
+        parsed = cache.parse(parse_sql_schema, path)
+        for table in parsed['tables']:
+            tables.setdefault(table['name'], dict(table, source=path))
+        for index in parsed['indexes']:
+            indexes.setdefault(index['name'], index)
+        rls.update(parsed['rls'])
+    for table in tables.values():
+        table['rls'] = table['name'] in rls
+    return list(tables.values()), list(indexes.values())
+
+
+def i18n_coverage(cache):
+    """(code, name, keys, missing, extra, same-as-English) per language, English first"""
+    names = cache.parse(parse_languages, f'{I18N_DIR}/index.ts')
+    en = cache.parse(parse_i18n, f'{I18N_DIR}/en.ts')
+    rows = []
+    for code, name in names:
+        strings = cache.parse(parse_i18n, f'{I18N_DIR}/{code}.ts')
+        missing = [k for k in en if k not in strings]
+        extra = [k for k in strings if k not in en]
+        same = [k for k in en if k in strings and strings[k] == en[k]]
+        rows.append((code, name, len(strings), missing, extra, same))
+    return len(en), rows
+
+
+def repo_modules(cache):
+    """(path, purpose, exports) for each TypeScript module under MODULE_DIRS"""
+    modules = []
+    for path in repo_files(*(f'{d}/*.ts' for d in MODULE_DIRS)):
+        parsed = cache.parse(parse_module, path)
+        modules.append((path, MODULE_NOTES.get(path) or parsed['summary'], parsed['exports']))
+    return modules
+
+
+# ── asset thumbnails ─────────────────────────────────────────────────────────
+# The gallery appendix shows every generated image. Each goes through a
+# thumbnail stage first: scaled down to its printed size at GALLERY_DPI and
+# re-encoded, cached by source hash so unchanged assets are never redone.
+
+ASSET_MANIFEST = 'public/asset-manifest.json'     # written by generate-icons.py
+THUMBNAILS = os.path.join(ROOT, '.docs-cache', 'thumbs')
+GALLERY_DPI = 150
+GALLERY_BOX = (1.5, 2.5)        # largest printed width, height in inches
+THUMB_JPEG_QUALITY = 85
+
+thumbnail_stats = {'built': 0, 'cached': 0}
+
+
+def print_size(width, height):
+    """Printed (width, height) in inches: native pixels at GALLERY_DPI, shrunk
+    to fit GALLERY_BOX — small icons are never blown up"""
+    scale = min(1 / GALLERY_DPI, GALLERY_BOX[0] / width, GALLERY_BOX[1] / height)
+    return width * scale, height * scale
+
+
+def thumbnail(rel_path):
+    """(thumbnail path, source (width, height), printed width) for one image.
+
+    The thumbnail is the smaller of a 256-color PNG and (for opaque images)
+    a JPEG. The file name is a hash of the source bytes and the settings.
+    """
+    from PIL import Image       # only the asset gallery needs Pillow
+
+    with open(os.path.join(ROOT, rel_path), 'rb') as f:
+        data = f.read()
+    with Image.open(io.BytesIO(data)) as img:
+        size = img.size
+        width, height = print_size(*size)
+        pixels = (max(1, round(width * GALLERY_DPI)), max(1, round(height * GALLERY_DPI)))
+        key = _digest(data + repr((pixels, THUMB_JPEG_QUALITY)).encode())[:24]
+        for ext in ('png', 'jpg'):
+            path = os.path.join(THUMBNAILS, f'{key}.{ext}')
+            if os.path.exists(path):
+                thumbnail_stats['cached'] += 1
+                return path, size, width
+
+        thumb = img.convert('RGBA')
+        if thumb.size != pixels:
+            thumb = thumb.resize(pixels, Image.LANCZOS)
+
+    def encode(image, fmt, **options):
+        buf = io.BytesIO()
+        image.save(buf, fmt, **options)
+        return buf.getvalue()
+
+    # Flat brand art palettizes well; a JPEG only competes when there is no alpha
+    candidates = [('png', encode(thumb.quantize(256, method=Image.Quantize.FASTOCTREE), 'PNG', optimize=True))]
+    if thumb.getextrema()[3][0] == 255:
+        candidates.append(('jpg', encode(thumb.convert('RGB'), 'JPEG',
+                                         quality=THUMB_JPEG_QUALITY, optimize=True)))
+    ext, encoded = min(candidates, key=lambda candidate: len(candidate[1]))
+    path = os.path.join(THUMBNAILS, f'{key}.{ext}')
+    with open(path + '.tmp', 'wb') as f:
+        f.write(encoded)
+    os.replace(path + '.tmp', path)
+    thumbnail_stats['built'] += 1
+    return path, size, width
+
+
+def asset_gallery():
+    """[(source, thumbnail, caption, printed width)] for every PNG in
+    ASSET_MANIFEST that exists; thumbnails no asset uses are deleted"""
+    try:
+        with open(os.path.join(ROOT, ASSET_MANIFEST)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return []
+    os.makedirs(THUMBNAILS, exist_ok=True)
+    figures = []
+    for rel_path in manifest:
+        if rel_path.endswith('.png') and os.path.exists(os.path.join(ROOT, rel_path)):
+            path, (w, h), width = thumbnail(rel_path)
+            size = os.path.getsize(os.path.join(ROOT, rel_path))
+            figures.append((rel_path, path, f'{rel_path} — {w}×{h} px, {size / 1024:.1f} KB', width))
+    used = {os.path.basename(figure[1]) for figure in figures}
+    for name in os.listdir(THUMBNAILS):
+        if name not in used:
+            os.remove(os.path.join(THUMBNAILS, name))
+    return figures
+
+
+# ── content model ────────────────────────────────────────────────────────────
+# build() writes the guide once as format-neutral nodes; renderers turn the
+# node list into DOCX, Markdown, HTML or the search index. Nodes are plain
+# namedtuples so a section pickles cheaply to renderer processes.
+
+Heading = namedtuple('Heading', 'level text')
+# role: body, strong, title, subtitle, meta, or a callout status (note, success, warning)
+Paragraph = namedtuple('Paragraph', 'text role label', defaults=('body', None))
+ListItem = namedtuple('ListItem', 'text ordered strong', defaults=(False, False))
+DataTable = namedtuple('DataTable', 'headers rows col_widths', defaults=(None,))
+Code = namedtuple('Code', 'text')
+Spacer = namedtuple('Spacer', '')
+# source is the repo-relative image, image its print-size thumbnail; width in inches
+Figure = namedtuple('Figure', 'source image caption width')
+
+# title is None for the front matter (title page + contents)
+Section = namedtuple('Section', 'title nodes')
+
+SECTION_HEADING = re.compile(r'\d+\. ')
+
+
+class Content:
+    """Node list split into sections — every numbered heading1 opens a new one"""
+
+    def __init__(self):
+        self.sections = [Section(None, [])]
+
+    def add(self, node):
+        if isinstance(node, Heading) and node.level == 1 and SECTION_HEADING.match(node.text):
+            self.sections.append(Section(node.text, []))
+        self.sections[-1].nodes.append(node)
 
 
 def heading1(doc, text):
-    p = doc.add_heading(text, level=1)
-    for r in p.runs:
-        r.font.color.rgb = BRAND
-        r.font.size = Pt(14)
+    doc.add(Heading(1, text))
 
 
 def heading2(doc, text):
-    p = doc.add_heading(text, level=2)
-    for r in p.runs:
-        r.font.color.rgb = BRAND
-        r.font.size = Pt(13)
+    doc.add(Heading(2, text))
 
 
-def bullet(doc, text):
-    doc.add_paragraph(text, style='List Bullet')
+def bullet(doc, text, strong=False):
+    doc.add(ListItem(text, strong=strong))
 
 
 def numbered(doc, text):
-    doc.add_paragraph(text, style='List Number')
+    doc.add(ListItem(text, ordered=True))
 
 
 def normal(doc, text):
-    doc.add_paragraph(text)
+    doc.add(Paragraph(text))
+
+
+def styled(doc, text, role):
+    """Title-page paragraph: role is title, subtitle or meta"""
+    doc.add(Paragraph(text, role))
+
+
+def spacer(doc):
+    doc.add(Spacer())
 
 
 def code_block(doc, text):
-    p = doc.add_paragraph()
-    r = p.add_run(text)
-    r.font.name = 'Courier New'
-    r.font.size = Pt(9)
+    doc.add(Code(text))
 
 
 def bold_normal(doc, text):
-    p = doc.add_paragraph()
-    r = p.add_run(text)
-    r.bold = True
-    return p
+    doc.add(Paragraph(text, 'strong'))
 
 
-# ── document ─────────────────────────────────────────────────────────────────
+def callout(doc, text, status='note', label=None):
+    """Status paragraph — note, success or warning — with an optional bold label"""
+    doc.add(Paragraph(text, status, label))
+
 
-def build():
-    doc = Document()
+def figure(doc, source, image, caption, width):
+    doc.add(Figure(source, image, caption, width))
 
-    # -- Default font
-    style = doc.styles['Normal']
-    style.font.name = 'Calibri'
-    style.font.size = Pt(11)
+
+def add_table(doc, headers, rows, col_widths=None):
+    """Table with a header row; col_widths are inches (print formats only)"""
+    doc.add(DataTable(headers, rows, col_widths))
+    spacer(doc)
+
+
+# ── DOCX renderer ────────────────────────────────────────────────────────────
+
+# Rows are parsed and moved into the document this many at a time: lxml's
+# cross-document move reconciles xml:space attributes in time quadratic in
+# the size of the moved subtree
+TABLE_CHUNK_ROWS = 500
+
+# Paragraph role -> registered style (None = Normal)
+ROLE_STYLES = {'body': None, 'strong': None, 'title': 'Oja Title', 'subtitle': 'Oja Subtitle',
+               'meta': 'Oja Title Meta', **CALLOUTS}
+
+
+def _xml_runs(text):
+    """Run XML for one cell's text — newlines become breaks, tabs become tabs,
+    as python-docx's cell.text setter does."""
+    if not text:
+        return ''
+    parts = []
+    for i, line in enumerate(text.split('\n')):
+        if i:
+            parts.append('<w:br/>')
+        for j, chunk in enumerate(line.split('\t')):
+            if j:
+                parts.append('<w:tab/>')
+            if chunk != chunk.strip():
+                parts.append(f'<w:t xml:space="preserve">{html.escape(chunk, quote=False)}</w:t>')
+            elif chunk:
+                parts.append(f'<w:t>{html.escape(chunk, quote=False)}</w:t>')
+    return f'<w:r>{"".join(parts)}</w:r>'
+
+
+def docx_table(doc, headers, rows, col_widths=None):
+    """Add a brand-styled table (see TABLE_STYLE) to a registered document.
+
+    Rows are written as XML strings and parsed in bulk, so cost is linear in
+    the cell count (python-docx rebuilds a row's cell grid on every .cells
+    access). Cells carry nothing but their width and text: font size, the
+    bold header and its shading all come from the table style. The header
+    row repeats on each page of long tables.
+    """
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+    from docx.shared import Emu, Inches
+    from docx.table import Table
+    n = len(headers)
+    if col_widths:
+        widths = [Inches(w).twips for w in col_widths]
+    else:
+        widths = [Emu(doc._block_width // n).twips] * n
+    tc_prs = [f'<w:tcPr><w:tcW w:w="{w}" w:type="dxa"/></w:tcPr>' for w in widths]
+
+    def row_xml(values, trpr=''):
+        cells = ''.join(f'<w:tc>{pr}<w:p>{_xml_runs(str(v))}</w:p></w:tc>'
+                        for pr, v in zip(tc_prs, values))
+        return f'<w:tr>{trpr}{cells}</w:tr>'
+
+    xml = [
+        f'<w:tbl {nsdecls("w")}><w:tblPr>'
+        f'<w:tblStyle w:val="{doc.styles[TABLE_STYLE].style_id}"/>'
+        '<w:tblW w:type="auto" w:w="0"/><w:jc w:val="left"/><w:tblLayout w:type="fixed"/>'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+        'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr><w:tblGrid>',
+        ''.join(f'<w:gridCol w:w="{w}"/>' for w in widths),
+        '</w:tblGrid>',
+        row_xml(headers, '<w:trPr><w:tblHeader/></w:trPr>'),
+        '</w:tbl>',
+    ]
+    tbl = parse_xml(''.join(xml))
+    doc.element.body.insert_element_before(tbl, 'w:sectPr')
+
+    for i in range(0, len(rows), TABLE_CHUNK_ROWS):
+        chunk = ''.join(row_xml(row) for row in rows[i:i + TABLE_CHUNK_ROWS])
+        tbl.extend(parse_xml(f'<w:tbl {nsdecls("w")}>{chunk}</w:tbl>'))
+    return Table(tbl, doc._body)
+
+
+def docx_style_ids(doc):
+    """{style name: style id} for the document, resolved once per render.
+
+    python-docx resolves a name on every paragraph.style / add_run(style=)
+    by scanning all styles for the default, which dominated large builds.
+    """
+    return {style.name: style.style_id for style in doc.styles}
+
+
+def docx_node(doc, node, style_ids):
+    from docx.shared import Inches
+    def paragraph(text=None, style=None):
+        p = doc.add_paragraph(text)
+        if style:
+            p._p.style = style_ids[style]
+        return p
+
+    def run(p, text, style=None):
+        r = p.add_run(text)
+        if style:
+            r._r.style = style_ids[style]
+
+    if isinstance(node, Heading):
+        paragraph(node.text, f'Heading {node.level}')
+    elif isinstance(node, Paragraph):
+        p = paragraph(style=ROLE_STYLES[node.role])
+        if node.label:
+            run(p, node.label, 'Oja Strong')
+        run(p, node.text, 'Oja Strong' if node.role == 'strong' else None)
+    elif isinstance(node, ListItem):
+        p = paragraph(style='List Number' if node.ordered else 'List Bullet')
+        run(p, node.text, 'Oja Strong' if node.strong else None)
+    elif isinstance(node, DataTable):
+        docx_table(doc, node.headers, node.rows, node.col_widths)
+    elif isinstance(node, Code):
+        paragraph(node.text, 'Oja Code')
+    elif isinstance(node, Figure):
+        paragraph().add_run().add_picture(node.image, width=Inches(node.width))
+        paragraph(node.caption, 'Oja Caption')
+    else:
+        doc.add_paragraph()
+
+
+# Each section's body XML is cached here, keyed on its nodes plus everything
+# shared that the XML depends on: the styles and numbering parts and the
+# DOCX renderer code
+DOCX_FRAGMENTS = os.path.join(ROOT, '.docs-cache', 'docx')
+
+# One-line summaries for build()'s report, by format (renderers may run in a worker)
+render_notes = {}
+
+
+def docx_shared_digest(doc):
+    """Hash of what every section's XML depends on besides its own nodes:
+    styles, numbering, the renderer functions and the tables they read"""
+    import inspect
+    from lxml import etree
+    h = hashlib.sha256()
+    h.update(etree.tostring(doc.styles.element))
+    h.update(etree.tostring(doc.part.numbering_part.element))
+    for fn in (docx_style_ids, docx_node, docx_table, _xml_runs, _link_images):
+        h.update(inspect.getsource(fn).encode())
+    h.update(repr((ROLE_STYLES, TABLE_CHUNK_ROWS, TABLE_STYLE)).encode())
+    return h.hexdigest()
+
+
+def section_key(section, shared):
+    return hashlib.sha256(f'{shared}{section!r}'.encode()).hexdigest()[:32]
+
+
+def _adopt(body, element):
+    """Move a cached element in before sectPr. Table rows move one by one:
+    moving a whole table at once is quadratic (see TABLE_CHUNK_ROWS)."""
+    from docx.oxml.ns import qn
+    rows = element.findall(qn('w:tr')) if element.tag == qn('w:tbl') else []
+    for row in rows:
+        element.remove(row)
+    body.insert_element_before(element, 'w:sectPr')
+    element.extend(rows)
+
+
+# Every zip entry gets the zip format's earliest timestamp, so identical
+# builds are identical bytes
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+def zip_entry(name, compress_type=None):
+    """ZipInfo carrying nothing that depends on when or where the build ran (deflated by default)"""
+    import zipfile
+    info = zipfile.ZipInfo(name, ZIP_EPOCH)
+    info.compress_type = zipfile.ZIP_DEFLATED if compress_type is None else compress_type
+    info.create_system = 3
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def package_names(names):
+    """[Content_Types].xml first (as OPC readers expect), then name order"""
+    return sorted(names, key=lambda name: (name != '[Content_Types].xml', name))
+
+
+def reproducible_zip(data, skip=()):
+    """data re-packed with fixed entry timestamps and order, minus the names in skip.
+
+    Entries are streamed through, so a large document.xml is never held
+    decompressed.
+    """
+    import zipfile
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as src, zipfile.ZipFile(out, 'w') as dst:
+        for name in package_names(src.namelist()):
+            if name not in skip:
+                with src.open(name) as fin, dst.open(zip_entry(name), 'w') as fout:
+                    shutil.copyfileobj(fin, fout)
+    return out.getvalue()
+
+
+def _link_images(doc, element):
+    """Point a cached element's pictures at image parts of this document.
+
+    A fragment keeps the relationship ids of the build that wrote it; each
+    picture is named after its thumbnail file, which is added to doc once.
+    """
+    from docx.oxml.ns import qn
+    for pic in element.iter(qn('pic:pic')):
+        name = pic.find(qn('pic:nvPicPr')).find(qn('pic:cNvPr')).get('name')
+        r_id, _ = doc.part.get_or_add_image(os.path.join(THUMBNAILS, name))
+        pic.find(f'.//{qn("a:blip")}').set(qn('r:embed'), r_id)
+
+
+def render_docx(sections, cache_dir=None):
+    """Build the .docx, splicing in cached section fragments where the key matches.
+
+    Only sections whose nodes (or the shared styles/numbering/renderer)
+    changed go through python-docx; their new fragments replace the old ones
+    and fragments no section uses any more are deleted.
+    """
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls, qn
+    from lxml import etree
+    cache_dir = cache_dir or DOCX_FRAGMENTS
+    doc = new_document()
+    body = doc.element.body
+    shared = docx_shared_digest(doc)
+    os.makedirs(cache_dir, exist_ok=True)
+    style_ids = docx_style_ids(doc)
+    used, built = set(), 0
+    for section in sections:
+        name = section_key(section, shared) + '.xml'
+        path = os.path.join(cache_dir, name)
+        used.add(name)
+        try:
+            with open(path, 'rb') as f:
+                fragment = parse_xml(f.read())
+        except OSError:
+            fragment = None
+        if fragment is not None:
+            for element in list(fragment):
+                _adopt(body, element)
+                _link_images(doc, element)
+            continue
+
+        first = len(body) - 1       # body ends with sectPr
+        for node in section.nodes:
+            docx_node(doc, node, style_ids)
+        xml = b''.join(etree.tostring(element) for element in body[first:len(body) - 1])
+        with open(path + '.tmp', 'wb') as f:
+            f.write(f'<w:body {nsdecls("w")}>'.encode() + xml + b'</w:body>')
+        os.replace(path + '.tmp', path)
+        built += 1
+
+    for name in os.listdir(cache_dir):
+        if name.endswith('.xml') and name not in used:
+            os.remove(os.path.join(cache_dir, name))
+    # Drawing ids must be unique; fragments from different builds may share some
+    for i, doc_pr in enumerate(body.iter(qn('wp:docPr')), 1):
+        doc_pr.set('id', str(i))
+    render_notes['docx'] = f'{built}/{len(sections)} sections rebuilt'
+
+    out = io.BytesIO()
+    doc.save(out)
+    return reproducible_zip(out.getvalue())
+
+
+# ── Markdown renderer ────────────────────────────────────────────────────────
+
+def _md_cell(value):
+    return str(value).replace('|', '\\|').replace('\n', '<br>')
+
+
+def markdown_node(node):
+    """Markdown for one node; headings shift down a level under the # title"""
+    if isinstance(node, Heading):
+        return f'{"#" * (node.level + 1)} {node.text}'
+    if isinstance(node, Paragraph):
+        label = f'**{node.label.strip()}** ' if node.label else ''
+        if node.role == 'title':
+            return f'# {node.text}'
+        if node.role == 'subtitle':
+            return f'_{node.text}_'
+        if node.role in ('strong', 'success', 'warning'):
+            text = f'**{node.text}**'
+        else:
+            text = node.text
+        return f'> {label}{text}' if node.role in CALLOUTS else f'{label}{text}'
+    if isinstance(node, ListItem):
+        text = f'**{node.text}**' if node.strong else node.text
+        return f'{"1." if node.ordered else "-"} {text}'
+    if isinstance(node, DataTable):
+        lines = ['| ' + ' | '.join(_md_cell(h) for h in node.headers) + ' |',
+                 '|' + '---|' * len(node.headers)]
+        lines += ['| ' + ' | '.join(_md_cell(v) for v in row) + ' |' for row in node.rows]
+        return '\n'.join(lines)
+    if isinstance(node, Code):
+        return f'```\n{node.text}\n```'
+    if isinstance(node, Figure):
+        # docs/setup-guide.md sits one level below the repo root
+        return f'![{node.caption}](../{node.source})'
+    return None
+
+
+def render_markdown(sections):
+    blocks, previous = [], None
+    for section in sections:
+        for node in section.nodes:
+            text = markdown_node(node)
+            if text is None:
+                continue
+            # consecutive list items stay one list
+            joined = isinstance(node, ListItem) and isinstance(previous, ListItem)
+            blocks.append(('\n' if joined else '\n\n') + text if blocks else text)
+            previous = node
+    return (''.join(blocks) + '\n').encode()
+
+
+# ── HTML renderer ────────────────────────────────────────────────────────────
+
+HTML_CSS = f'''
+body {{ font-family: Calibri, 'Segoe UI', sans-serif; font-size: 11pt; max-width: 52rem;
+       margin: 2rem auto; padding: 0 1rem; color: #1C1917; line-height: 1.45; }}
+h1, h2 {{ color: #{BRAND}; }}
+h1 {{ font-size: 14pt; margin-top: 2rem; }}
+h2 {{ font-size: 13pt; }}
+.title {{ color: #{BRAND}; font-size: 36pt; font-weight: bold; text-align: center; margin: 3rem 0 0; }}
+.subtitle {{ color: #{GRAY}; font-size: 16pt; text-align: center; }}
+.meta {{ font-size: 12pt; text-align: center; margin: 0; }}
+.note {{ margin-left: 0.2in; }}
+.success {{ color: #{GREEN}; font-weight: bold; }}
+.warning {{ color: #{AMBER}; font-weight: bold; }}
+table {{ border-collapse: collapse; font-size: 10pt; margin: 0.5rem 0 1rem; }}
+th, td {{ border: 1px solid #000; padding: 2px 6px; text-align: left; vertical-align: top; }}
+th {{ background: #{TABLE_HEADER_FILL}; }}
+pre {{ font-family: 'Courier New', monospace; font-size: 9pt; white-space: pre-wrap; }}
+figure {{ margin: 0.5rem 0 1rem; }}
+figcaption {{ color: #{GRAY}; font-size: 9pt; }}
+'''
+
+
+def _slug(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def _html_text(text):
+    return html.escape(str(text)).replace('\n', '<br>')
+
+
+def html_node(node):
+    if isinstance(node, Heading):
+        return f'<h{node.level} id="{_slug(node.text)}">{html.escape(node.text)}</h{node.level}>'
+    if isinstance(node, Paragraph):
+        label = f'<strong>{html.escape(node.label)}</strong>' if node.label else ''
+        text = _html_text(node.text)
+        if node.role == 'strong':
+            return f'<p><strong>{text}</strong></p>'
+        cls = '' if node.role == 'body' else f' class="{node.role}"'
+        return f'<p{cls}>{label}{text}</p>'
+    if isinstance(node, ListItem):
+        text = _html_text(node.text)
+        return f'<li><strong>{text}</strong></li>' if node.strong else f'<li>{text}</li>'
+    if isinstance(node, DataTable):
+        head = ''.join(f'<th>{_html_text(h)}</th>' for h in node.headers)
+        body = ''.join('<tr>' + ''.join(f'<td>{_html_text(v)}</td>' for v in row) + '</tr>'
+                       for row in node.rows)
+        return f'<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>'
+    if isinstance(node, Code):
+        return f'<pre><code>{html.escape(node.text)}</code></pre>'
+    if isinstance(node, Figure):
+        # Thumbnails are inlined so the page stands alone, like the .docx
+        with open(node.image, 'rb') as f:
+            data = base64.b64encode(f.read()).decode()
+        mime = 'image/jpeg' if node.image.endswith('.jpg') else 'image/png'
+        return (f'<figure><img src="data:{mime};base64,{data}" alt="{html.escape(node.source)}" '
+                f'style="width: {node.width:.2f}in"><figcaption>{html.escape(node.caption)}</figcaption></figure>')
+    return ''
+
+
+def render_html(sections):
+    parts, open_list = [], None
+    for section in sections:
+        for node in section.nodes:
+            tag = ('ol' if node.ordered else 'ul') if isinstance(node, ListItem) else None
+            if tag != open_list:
+                if open_list:
+                    parts.append(f'</{open_list}>')
+                if tag:
+                    parts.append(f'<{tag}>')
+                open_list = tag
+            parts.append(html_node(node))
+    if open_list:
+        parts.append(f'</{open_list}>')
+    body = '\n'.join(p for p in parts if p)
+    return (f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            f'<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+            f'<title>Oja POS — Setup &amp; Reference Guide</title>\n<style>{HTML_CSS}</style>\n'
+            f'</head>\n<body>\n{body}\n</body>\n</html>\n').encode()
+
+
+# ── search index ─────────────────────────────────────────────────────────────
+# A prebuilt inverted index lets the app search the guide offline without
+# scanning its text. Each normalised term maps to postings of (entry, weight).
+# An entry is one heading, paragraph, list item, table row, code block or
+# caption. As with the DOCX fragments, each section's slice is cached and
+# only changed sections are tokenised again.
+
+INDEX_FRAGMENTS = os.path.join(ROOT, '.docs-cache', 'index')
+INDEX_VERSION = 1
+# A term in a heading counts this many times over, by heading level
+TITLE_BOOST = {1: 8, 2: 4}
+# Postings pack a weight of up to WEIGHT_MAX into their low bits
+WEIGHT_BITS = 4
+WEIGHT_MAX = (1 << WEIGHT_BITS) - 1
+SNIPPET_CHARS = 120
+INDEX_TERM = re.compile(r'[a-z0-9]+')
+STOPWORDS = frozenset('a an and are as at be by can do for from has have how if in into is it its '
+                      'not of on or so than that the then there this to was what when where which '
+                      'will with you your'.split())
+
+
+def index_terms(text):
+    """Lowercased, ASCII-folded words, minus stopwords and single characters.
+
+    The app normalises a query the same way, and the file carries the stopword list.
+    """
+    folded = unicodedata.normalize('NFKD', str(text)).encode('ascii', 'ignore').decode().lower()
+    return [t for t in INDEX_TERM.findall(folded) if len(t) > 1 and t not in STOPWORDS]
+
+
+def index_entries(section):
+    """(anchor, text, boost) for every searchable node of a section.
+
+    anchor is the slug of the nearest heading above, which is the id the HTML renderer uses.
+    """
+    anchor = _slug(section.title) if section.title else ''
+    for node in section.nodes:
+        if isinstance(node, Heading):
+            anchor = _slug(node.text)
+            yield anchor, node.text, TITLE_BOOST.get(node.level, 1)
+        elif isinstance(node, Paragraph):
+            text = f'{node.label} {node.text}' if node.label else node.text
+            yield anchor, text, TITLE_BOOST[2] if node.role == 'title' else 1
+        elif isinstance(node, (ListItem, Code)):
+            yield anchor, node.text, 1
+        elif isinstance(node, DataTable):
+            for row in node.rows:
+                yield anchor, ' · '.join(str(value) for value in row), 1
+        elif isinstance(node, Figure):
+            yield anchor, node.caption, 1
+
+
+def index_section(section):
+    """One section's slice of the index: {'entries': [[anchor, snippet]], 'terms': {...}}.
+
+    Each term maps to its last entry followed by its packed postings.
+    Entries in a packed posting store the gap from the previous posting,
+    shifted past WEIGHT_BITS, plus the weight capped to fit. Most gaps and
+    weights are small, so a posting is usually two or three digits. Gaps
+    start from entry 0 of the section, so merging a slice only adjusts a
+    term's first posting.
+    """
+    entries, terms, last = [], {}, {}
+    for anchor, text, boost in index_entries(section):
+        counts = {}
+        for term in index_terms(text):
+            counts[term] = counts.get(term, 0) + boost
+        if not counts:
+            continue
+        snippet = ' '.join(str(text).split())
+        if len(snippet) > SNIPPET_CHARS:
+            snippet = snippet[:SNIPPET_CHARS - 1].rstrip() + '…'
+        entry = len(entries)
+        for term, weight in counts.items():
+            gap = entry - last.get(term, 0)
+            terms.setdefault(term, []).append(gap << WEIGHT_BITS | min(weight, WEIGHT_MAX))
+            last[term] = entry
+        entries.append([anchor, snippet])
+    return {'entries': entries, 'terms': {term: [last[term], *postings] for term, postings in terms.items()}}
+
+
+def render_search_index(sections, cache_dir=None):
+    """The guide's inverted index as compact JSON.
+
+    - sections: [title, anchor] per section.
+    - anchors: [section, anchor] per heading.
+    - entries: [anchor, snippet], where anchor indexes anchors.
+    - terms: sorted, so a prefix lookup is a binary search.
+      Each term maps to packed postings (see index_section).
+    """
+    import inspect
+    cache_dir = cache_dir or INDEX_FRAGMENTS
+    os.makedirs(cache_dir, exist_ok=True)
+    shared = hashlib.sha256(b''.join(inspect.getsource(fn).encode() for fn in
+                                     (index_terms, index_entries, index_section))).hexdigest()
+    used, built = set(), 0
+    titles, anchors, entries, terms, ends = [], {}, [], {}, {}
+    for number, section in enumerate(sections):
+        name = section_key(section, shared) + '.json'
+        path = os.path.join(cache_dir, name)
+        used.add(name)
+        try:
+            with open(path, encoding='utf-8') as f:
+                part = json.load(f)
+        except (OSError, ValueError):
+            part = index_section(section)
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                # dumps, not dump: only dumps uses the C encoder
+                f.write(json.dumps(part, ensure_ascii=False, separators=(',', ':')))
+            os.replace(path + '.tmp', path)
+            built += 1
+
+        offset = len(entries)
+        titles.append([section.title or 'Oja POS', _slug(section.title) if section.title else ''])
+        entries.extend([anchors.setdefault((number, anchor), len(anchors)), snippet]
+                       for anchor, snippet in part['entries'])
+        for term, (end, first, *rest) in part['terms'].items():
+            merged = terms.setdefault(term, [])
+            merged.append(first + ((offset - ends.get(term, 0)) << WEIGHT_BITS))
+            merged += rest
+            ends[term] = offset + end
+
+    for name in os.listdir(cache_dir):
+        if name.endswith('.json') and name not in used:
+            os.remove(os.path.join(cache_dir, name))
+    render_notes['index'] = f'{len(terms)} terms, {built}/{len(sections)} sections rebuilt'
+
+    index = {'version': INDEX_VERSION, 'weight_bits': WEIGHT_BITS, 'stopwords': sorted(STOPWORDS),
+             'sections': titles, 'anchors': [list(key) for key in anchors], 'entries': entries,
+             'terms': dict(sorted(terms.items()))}
+    return (json.dumps(index, ensure_ascii=False, separators=(',', ':')) + '\n').encode()
+
+
+# format -> (renderer, default output path). The print formats go to
+# ~/Documents; the Markdown guide and the search index ship in the repo.
+RENDERERS = {
+    'docx': (render_docx, OUTPUT),
+    'md': (render_markdown, os.path.join(ROOT, 'docs', 'setup-guide.md')),
+    'html': (render_html, os.path.splitext(OUTPUT)[0] + '.html'),
+    'index': (render_search_index, os.path.join(ROOT, 'docs', 'search-index.json')),
+}
+
+
+# ── document ─────────────────────────────────────────────────────────────────
+
+def guide_content(sources):
+    """The whole guide as sections of format-neutral nodes"""
+    doc = Content()
 
     # ── Title page ───────────────────────────────────────────────────────
-    doc.add_paragraph()  # spacer
-    doc.add_paragraph()  # spacer
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    r = p.add_run('OJA POS')
-    r.bold = True
-    r.font.size = Pt(36)
-    r.font.color.rgb = BRAND
-
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    r = p.add_run('Setup, Configuration & Troubleshooting Guide')
-    r.font.size = Pt(16)
-    r.font.color.rgb = GRAY
-
-    doc.add_paragraph()  # spacer
-
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    r = p.add_run(f'Last Updated: {LAST_UPDATED}')
-    r.font.size = Pt(12)
-
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    r = p.add_run(f'Version {VERSION}')
-    r.font.size = Pt(12)
+    spacer(doc)
+    spacer(doc)
+    styled(doc, 'OJA POS', 'title')
+    styled(doc, 'Setup, Configuration & Troubleshooting Guide', 'subtitle')
+    spacer(doc)
+    styled(doc, f'Last Updated: {LAST_UPDATED}', 'meta')
+    styled(doc, f'Version {VERSION}', 'meta')
 
     # ── Table of Contents ────────────────────────────────────────────────
-    doc.add_paragraph()
+    spacer(doc)
     heading1(doc, 'Table of Contents')
     toc_items = [
         '1. Project Overview',
@@ -159,6 +1140,7 @@ def build():
         '14. Deployment Commands',
         '15. Troubleshooting Guide',
         '16. Future Roadmap',
+        '17. Appendix: Asset Gallery',
     ]
     for item in toc_items:
         numbered(doc, item)
@@ -228,14 +1210,20 @@ def build():
     ], col_widths=[2.5, 4.0])
 
     heading2(doc, 'Key Files')
-    bullet(doc, 'src/lib/storage.ts — Platform-specific storage adapter (MMKV native, localStorage web)')
-    bullet(doc, 'src/lib/syncService.ts — Cloud sync logic (Supabase ↔ local, 5-min interval)')
-    bullet(doc, 'src/lib/paystack.ts — Paystack client (initializePayment, verifyPayment)')
-    bullet(doc, 'src/lib/activationCode.ts — HMAC-SHA256 code generation + validation')
-    bullet(doc, 'src/lib/premiumFeatures.ts — Feature access map + canAccess() helper')
-    bullet(doc, 'src/lib/lowStockAlerts.ts — WhatsApp inventory alert system')
-    bullet(doc, 'src/lib/printerService.ts — Bluetooth thermal printer + web print fallback')
-    bullet(doc, 'src/store/subscriptionStore.ts — Tier management (starter/business)')
+    add_table(doc, ['Module', 'Purpose', 'Exports'], [
+        [path, purpose or '—', ', '.join(exports[:4]) + (f' +{len(exports) - 4} more' if len(exports) > 4 else '')]
+        for path, purpose, exports in repo_modules(sources)
+    ], col_widths=[2.2, 2.6, 1.7])
+
+    heading2(doc, 'Translations')
+    en_strings, languages = i18n_coverage(sources)
+    normal(doc, f'{en_strings} strings in {I18N_DIR}/en.ts. Missing keys fall back to English '
+                f'(t() in {I18N_DIR}/index.ts); "Same as English" counts strings left untranslated.')
+    add_table(doc, ['Language', 'File', 'Strings', 'Missing', 'Extra', 'Same as English'], [
+        [name, f'{code}.ts', str(count), str(len(missing)), str(len(extra)),
+         '—' if code == 'en' else str(len(same))]
+        for code, name, count, missing, extra, same in languages
+    ], col_widths=[1.3, 1.0, 0.9, 0.9, 0.9, 1.5])
 
     # ── 4. Domain & DNS Setup ────────────────────────────────────────────
     heading1(doc, '4. Domain & DNS Setup')
@@ -290,7 +1278,7 @@ def build():
     normal(doc, 'The landing page is in the oja-landing/ directory (sibling to oja-pos):')
     code_block(doc, 'cd oja-landing\nnpx vercel --prod --yes --token "$VERCEL_TOKEN"')
 
-    doc.add_paragraph()
+    spacer(doc)
     normal(doc, 'Important: The Vercel token is stored in oja-pos/.env as VERCEL_TOKEN. '
                 'Source it before running deploy commands.')
 
@@ -305,18 +1293,24 @@ def build():
         ['Auth', 'Email/password (no social login yet)'],
     ], col_widths=[2.0, 4.5])
 
-    heading2(doc, 'Database Tables (8 total)')
-    add_table(doc, ['Table', 'Description'], [
-        ['shops', 'Shop profiles'],
-        ['shop_members', 'Staff linked to shops'],
-        ['products', 'Product catalog'],
-        ['sales', 'Transaction records'],
-        ['customers', 'Customer directory'],
-        ['expenses', 'Expense tracking'],
-        ['subscriptions', 'Premium tier subscriptions (Paystack + activation codes)'],
-        ['sync_log', 'Cloud sync tracking'],
-    ], col_widths=[2.5, 4.0])
-    normal(doc, 'All tables have Row Level Security (RLS) enabled. Users can only access data belonging to their shop.')
+    tables, indexes = repo_schema(sources)
+    heading2(doc, f'Database Tables ({len(tables)} total)')
+    add_table(doc, ['Table', 'Description', 'Columns', 'Defined In'], [
+        [t['name'], t['comment'] or '—', str(len(t['columns'])), t['source']]
+        for t in tables
+    ], col_widths=[1.5, 2.4, 0.8, 1.8])
+    no_rls = [t['name'] for t in tables if not t['rls']]
+    if no_rls:
+        normal(doc, f'Row Level Security (RLS) is NOT enabled on: {", ".join(no_rls)}.')
+    else:
+        normal(doc, 'All tables have Row Level Security (RLS) enabled. Shop data is only visible to members '
+                    'of that shop; analytics and subscriptions are readable by the service role.')
+
+    heading2(doc, f'Indexes ({len(indexes)} total)')
+    add_table(doc, ['Index', 'Table', 'Columns'], [
+        [i['name'] + (' (unique)' if i['unique'] else ''), i['table'], ', '.join(i['columns'])]
+        for i in indexes
+    ], col_widths=[2.5, 1.8, 2.2])
 
     heading2(doc, 'Edge Functions')
     add_table(doc, ['Function', 'URL', 'JWT'], [
@@ -342,11 +1336,9 @@ def build():
     normal(doc, '7. Paystack also sends webhook for server-side confirmation (backup)')
 
     # NEW: Redundancy note
-    p = doc.add_paragraph()
-    r = p.add_run('Note: ')
-    r.bold = True
-    r2 = p.add_run('The verify edge function also creates/updates the subscription in Supabase '
-                    '(not just the webhook). Both paths write to the subscriptions table for redundancy.')
+    callout(doc, 'The verify edge function also creates/updates the subscription in Supabase '
+                 '(not just the webhook). Both paths write to the subscriptions table for redundancy.',
+            label='Note: ')
 
     heading2(doc, 'Keys (Currently TEST)')
     add_table(doc, ['Key', 'Value'], [
@@ -359,9 +1351,7 @@ def build():
     bullet(doc, 'Log into Paystack dashboard (dashboard.paystack.com)')
     bullet(doc, 'Set webhook URL: https://bjpqdfcpclmcxyydtcmm.supabase.co/functions/v1/paystack-webhook')
     # NEW: Mark webhook as done
-    p = doc.add_paragraph('Webhook URL has been set in Paystack dashboard ✅', style='List Bullet')
-    for r in p.runs:
-        r.bold = True
+    bullet(doc, 'Webhook URL has been set in Paystack dashboard ✅', strong=True)
     bullet(doc, 'Switch to Live mode and get live keys')
     bullet(doc, 'Update public key in src/lib/paystack.ts')
     bullet(doc, 'Update secret key in Supabase edge function secrets')
@@ -369,11 +1359,9 @@ def build():
     bullet(doc, 'Test a real ₦100 payment end-to-end')
 
     # NEW: End-to-end test result
-    p = doc.add_paragraph()
-    r = p.add_run('✅ End-to-end test completed successfully on Feb 1 2026 — payment processed, '
-                   'verify edge function confirmed, subscription record created in Supabase.')
-    r.bold = True
-    r.font.color.rgb = RGBColor(0x22, 0x7A, 0x22)  # dark green
+    callout(doc, '✅ End-to-end test completed successfully on Feb 1 2026 — payment processed, '
+                 'verify edge function confirmed, subscription record created in Supabase.',
+            'success')
 
     # ── 8. Email Setup ───────────────────────────────────────────────────
     heading1(doc, '8. Email Setup (Zoho Mail)')
@@ -482,7 +1470,7 @@ def build():
         '#   --count N     Number of codes to generate (default: 10)\n'
         '#   --duration N  Subscription duration in days (default: 30)\n'
         '#   --output FILE Output file path')
-    doc.add_paragraph()
+    spacer(doc)
     normal(doc, 'Generated codes are saved to scripts/codes-YYYY-MM-DD.txt')
 
     heading2(doc, 'How It Works')
@@ -612,10 +1600,356 @@ def build():
     bullet(doc, 'Supplier ordering system')
     bullet(doc, 'iOS App Store + Google Play Store releases')
 
-    # ── Save ─────────────────────────────────────────────────────────────
-    doc.save(OUTPUT)
-    print(f'✅ Generated: {OUTPUT}')
+    # ── 17. Appendix: Asset Gallery ──────────────────────────────────────
+    heading1(doc, '17. Appendix: Asset Gallery')
+    normal(doc, f'Every image generate-icons.py writes (listed in {ASSET_MANIFEST}), at print size: '
+                f'native pixels at {GALLERY_DPI} DPI, scaled down to fit {GALLERY_BOX[0]} x {GALLERY_BOX[1]} in. '
+                'The WebP files are other encodings of the same pixels and are not repeated.')
+    try:
+        figures = asset_gallery()
+    except ImportError:
+        figures = None
+        callout(doc, 'Pillow is not installed (pip install pillow), so the gallery is empty.', 'warning')
+    for source, image, caption, width in figures or ():
+        figure(doc, source, image, caption, width)
+
+    return doc.sections
+
+
+# ── setup sheets (mail merge) ────────────────────────────────────────────────
+# One personalized setup sheet per shop, for bulk onboarding through
+# resellers. The sheet is rendered once with {{field}} placeholders and kept
+# as its .docx package; a record only swaps its values into document.xml.
+
+CODE_FILES = 'scripts/codes-*.txt'
+# Codes earlier merges handed out, with the shop each went to. Commit it next
+# to the code files: codes are single-use, and without the ledger a second
+# batch would give the same codes to different shops.
+ISSUED_CODES = os.path.join(ROOT, 'scripts', 'issued-codes.csv')
+MERGE_OUTPUT = os.path.expanduser('~/Documents/Oja POS - Setup Sheets.zip')
+MERGE_FIELDS = ('shop', 'code', 'tier', 'days', 'contact')
+MERGE_PLACEHOLDER = re.compile(r'\{\{(\w+)\}\}')
+SUPPORT_CONTACTS = [
+    ['Email', 'hello@ojapos.app'],
+    ['Web App', 'https://app.ojapos.app'],
+]
+
+# Every activation code unlocks Business; the first payload character is the
+# duration (see DURATION_MAP in scripts/generate-codes.js)
+ACTIVATION_CODE = re.compile(r'^OJA-[2-9A-Z]{4}-[2-9A-Z]{4}$', re.M)
+CODE_TIER = 'Business'
+CODE_DAYS = {'A': 30, 'B': 90, 'C': 180, 'D': 365}
+
+# Records per pool task: big enough that pickling is noise, small enough
+# that the zip keeps streaming
+MERGE_CHUNK = 32
+
+
+def parse_codes(text):
+    return ACTIVATION_CODE.findall(text)
+
+
+def load_issued(path=ISSUED_CODES):
+    """{code: shop} from the issued-codes ledger — empty until the first merge"""
+    try:
+        with open(path, newline='', encoding='utf-8') as f:
+            return {row['code']: row['shop'] for row in csv.DictReader(f)}
+    except FileNotFoundError:
+        return {}
+
+
+def record_issued(records, path=ISSUED_CODES):
+    """Append the records' codes the ledger doesn't hold yet — returns how many"""
+    issued = load_issued(path)
+    new = [record for record in records if record['code'] not in issued]
+    if new:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        header = not os.path.exists(path)
+        with open(path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            if header:
+                writer.writerow(['code', 'shop'])
+            writer.writerows([record['code'], record['shop']] for record in new)
+    return len(new)
+
+
+def merge_records(path, cache, code_files=CODE_FILES, issued=None):
+    """One field dict per row of the shops CSV.
+
+    The CSV needs a shop column; contact (the reseller) and code are
+    optional. Rows without a code get the next one from code_files that no
+    row names and issued ({code: shop}, see load_issued) doesn't hold, in
+    file order. A named code may only be one issued to that same shop (a
+    reprint).
+    """
+    issued = issued or {}
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        rows = [(reader.line_num, row) for row in reader]
+    if not rows or 'shop' not in reader.fieldnames:
+        raise ValueError(f'{path}: expected a CSV with a "shop" column')
+    codes = [code for rel in repo_files(code_files) for code in cache.parse(parse_codes, rel)]
+    known = set(codes)
+    named = {row['code'].strip() for _, row in rows if (row.get('code') or '').strip()}
+    spare = [code for code in codes if code not in named and code not in issued]
+    spare_codes = iter(spare)
+
+    records, seen = [], set()
+    for line, row in rows:
+        if None in row:
+            raise ValueError(f'{path}:{line}: more fields than the header has columns')
+        shop = (row['shop'] or '').strip()
+        if not shop:
+            raise ValueError(f'{path}:{line}: no shop name')
+        code = (row.get('code') or '').strip() or next(spare_codes, None)
+        if code is None:
+            raise ValueError(f'{path}: {len(rows)} shops but only {len(spare)} unissued activation '
+                             f'codes in {code_files}')
+        if code not in known:
+            raise ValueError(f'{path}:{line}: {code} is not in {code_files}')
+        if code in seen:
+            raise ValueError(f'{path}:{line}: {code} is used twice')
+        if issued.get(code, shop) != shop:
+            raise ValueError(f'{path}:{line}: {code} was already issued to {issued[code]!r}')
+        seen.add(code)
+        records.append({
+            'shop': shop,
+            'code': code,
+            'tier': CODE_TIER,
+            'days': str(CODE_DAYS[code[4]]),
+            'contact': (row.get('contact') or '').strip() or SUPPORT_CONTACTS[0][1],
+        })
+    return records
+
+
+def setup_sheet_content():
+    """The per-shop setup sheet, with {{field}} placeholders for MERGE_FIELDS"""
+    doc = Content()
+    styled(doc, 'OJA POS', 'title')
+    styled(doc, 'Setup Sheet for {{shop}}', 'subtitle')
+    spacer(doc)
+
+    heading1(doc, 'Your Account')
+    add_table(doc, ['Property', 'Value'], [
+        ['Shop', '{{shop}}'],
+        ['Activation Code', '{{code}}'],
+        ['Plan', '{{tier}} — {{days}} days'],
+        ['Your Contact', '{{contact}}'],
+    ], col_widths=[2.0, 4.5])
+
+    heading1(doc, 'Getting Started')
+    numbered(doc, 'Open https://app.ojapos.app (or the Oja POS app) and create your shop')
+    numbered(doc, 'Go to Subscription and tap "Have an activation code?"')
+    numbered(doc, 'Enter {{code}} to unlock the {{tier}} plan for {{days}} days')
+    callout(doc, 'Each code can be used once. Keep this sheet until your shop is activated.',
+            'note', 'Note: ')
+
+    heading1(doc, 'Support')
+    add_table(doc, ['Channel', 'Contact'], SUPPORT_CONTACTS, col_widths=[2.0, 4.5])
+    return doc.sections
+
+
+def merge_template(sections):
+    """Render sections once for stamping.
+
+    Returns the package minus word/document.xml, already zipped, and
+    document.xml split on its placeholders (odd items are field names), so
+    a sheet only deflates its own document.xml.
+    """
+    import zipfile
+    doc = new_document()
+    style_ids = docx_style_ids(doc)
+    for section in sections:
+        for node in section.nodes:
+            docx_node(doc, node, style_ids)
+    package = io.BytesIO()
+    doc.save(package)
+    with zipfile.ZipFile(package) as z:
+        xml = z.read('word/document.xml').decode('utf-8')
+    shared = reproducible_zip(package.getvalue(), skip={'word/document.xml'})
+    parts = MERGE_PLACEHOLDER.split(xml)
+    unknown = set(parts[1::2]) - set(MERGE_FIELDS)
+    if unknown:
+        raise ValueError(f'setup sheet uses unknown field(s): {", ".join(sorted(unknown))}')
+    return shared, parts
+
+
+def sheet_name(record):
+    return f'{_slug(record["shop"]) or "shop"}-{record["code"]}.docx'
+
+
+# The template each pool worker stamps, set by merge_init
+_sheet = None
+
+
+def merge_init(template):
+    global _sheet
+    _sheet = template
+
+
+def stamp_sheet(record):
+    """One shop's .docx: the shared parts plus document.xml with record's values"""
+    import zipfile
+    shared, parts = _sheet
+    xml = ''.join(html.escape(record[part], quote=False) if i % 2 else part
+                  for i, part in enumerate(parts))
+    out = io.BytesIO(shared)
+    out.seek(0, io.SEEK_END)
+    with zipfile.ZipFile(out, 'a') as z:
+        z.writestr(zip_entry('word/document.xml'), xml.encode('utf-8'))
+    return out.getvalue()
+
+
+def merge(shops, out=None, jobs=None, code_files=CODE_FILES, issued=ISSUED_CODES):
+    """Stamp a setup sheet per record in shops into one zip.
+
+    out is a path (default MERGE_OUTPUT) or a binary stream such as stdout.
+    Sheets are written as workers finish them (in record order), so memory
+    stays flat however many shops there are. Once the zip is written, the
+    codes it hands out are added to the issued ledger.
+    """
+    import zipfile
+    from concurrent.futures import ProcessPoolExecutor
+    out = out or MERGE_OUTPUT
+    start = time.perf_counter()
+    sources = SourceCache()
+    records = merge_records(shops, sources, code_files, load_issued(issued))
+    sources.save()
+    template = merge_template(setup_sheet_content())
+    stamp_start = time.perf_counter()
+    print(f'📝 Template: {len(records)} record(s), built in {(stamp_start - start) * 1000:.0f} ms')
+
+    def write_sheets(stream):
+        with zipfile.ZipFile(stream, 'w') as z:
+            if jobs == 1:
+                merge_init(template)
+                sheets, pool = map(stamp_sheet, records), None
+            else:
+                pool = ProcessPoolExecutor(max_workers=jobs, initializer=merge_init, initargs=(template,))
+                sheets = pool.map(stamp_sheet, records, chunksize=MERGE_CHUNK)
+            try:
+                for record, data in zip(records, sheets):
+                    # stored: every .docx is already deflated
+                    z.writestr(zip_entry(sheet_name(record), zipfile.ZIP_STORED), data)
+            finally:
+                if pool:
+                    pool.shutdown()
+
+    if not hasattr(out, 'write'):
+        os.makedirs(os.path.dirname(out) or '.', exist_ok=True)
+        with open(out + '.tmp', 'wb') as f:
+            write_sheets(f)
+        os.replace(out + '.tmp', out)
+        print(f'✅ Generated: {out} ({len(records)} sheets, {os.path.getsize(out) / 1024:.0f} KB)')
+    elif out.seekable():
+        write_sheets(out)
+    else:
+        # Zipped straight into a pipe, entries get data descriptors; spooling
+        # keeps the bytes identical to a file build
+        with tempfile.TemporaryFile() as f:
+            write_sheets(f)
+            f.seek(0)
+            shutil.copyfileobj(f, out)
+    print(f'🎟  {record_issued(records, issued)} new code(s) recorded in {issued}')
+    per_sheet = (time.perf_counter() - stamp_start) / max(len(records), 1)
+    print(f'⏱  {time.perf_counter() - start:.2f}s total ({per_sheet * 1000:.2f} ms per sheet)')
+    return out
+
+
+def render(fmt):
+    """The guide in one format as bytes — only the caches are written"""
+    sources = SourceCache()
+    sections = guide_content(sources)
+    sources.save()
+    return RENDERERS[fmt][0](sections)
+
+
+def _render(fmt, sections):
+    """Worker entry point — returns (format, bytes, seconds, note)"""
+    start = time.perf_counter()
+    data = RENDERERS[fmt][0](sections)
+    return fmt, data, time.perf_counter() - start, render_notes.get(fmt)
+
+
+def build(formats=None, out_dir=None, jobs=None):
+    """One content pass, then every renderer at once on a process pool.
+
+    Wall time is the content pass plus the slowest renderer. Returns
+    {format: output path}.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    formats = formats or list(RENDERERS)
+    start = time.perf_counter()
+    sources = SourceCache()
+    sections = guide_content(sources)
+    sources.save()
+    content_seconds = time.perf_counter() - start
+    print(f'📝 Content: {len(sections)} sections in {content_seconds * 1000:.0f} ms '
+          f'({sources.misses} source(s) parsed, {sources.hits} from {os.path.relpath(SOURCE_CACHE, ROOT)}; '
+          f'{thumbnail_stats["built"]} thumbnail(s) built, {thumbnail_stats["cached"]} cached)')
+
+    jobs = jobs or len(formats)
+    if jobs == 1 or len(formats) == 1:
+        results = [_render(fmt, sections) for fmt in formats]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(formats))) as pool:
+            results = list(pool.map(_render, formats, [sections] * len(formats)))
+
+    outputs = {}
+    for fmt, data, seconds, note in results:
+        path = RENDERERS[fmt][1]
+        if out_dir:
+            path = os.path.join(out_dir, os.path.basename(path))
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        outputs[fmt] = path
+        print(f'✅ Generated: {path} ({len(data) / 1024:.0f} KB, {seconds * 1000:.0f} ms'
+              f'{", " + note if note else ""})')
+    print(f'⏱  {time.perf_counter() - start:.2f}s total')
+    return outputs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate the Oja POS setup & reference guide')
+    parser.add_argument('--format', action='append', choices=list(RENDERERS), dest='formats',
+                        help='output format (repeatable, default: all)')
+    parser.add_argument('--out-dir', help='write every format into this directory instead')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='renderer processes (default: one per format, 1 = in-process)')
+    parser.add_argument('--merge', metavar='SHOPS_CSV',
+                        help='instead of the guide, zip one setup sheet per shop in SHOPS_CSV '
+                             '(columns: shop, optional code and contact)')
+    parser.add_argument('--codes', default=CODE_FILES,
+                        help=f'activation code files for --merge (default: {CODE_FILES})')
+    parser.add_argument('--issued', default=ISSUED_CODES,
+                        help='ledger of codes earlier merges handed out; --merge skips them and '
+                             'appends its own (default: scripts/issued-codes.csv)')
+    parser.add_argument('--stdout', action='store_true',
+                        help='write the one --format (or the --merge zip) to stdout; progress goes to stderr')
+    args = parser.parse_args(argv)
+    if args.stdout:
+        if not args.merge and len(args.formats or ()) != 1:
+            parser.error('--stdout needs exactly one --format')
+        stdout = sys.stdout.buffer
+        with contextlib.redirect_stdout(sys.stderr):
+            if args.merge:
+                try:
+                    merge(args.merge, stdout, args.jobs, args.codes, args.issued)
+                except (OSError, ValueError) as e:
+                    parser.error(f'--merge: {e}')
+            else:
+                stdout.write(render(args.formats[0]))
+        return
+    if args.merge:
+        out = os.path.join(args.out_dir, os.path.basename(MERGE_OUTPUT)) if args.out_dir else None
+        try:
+            merge(args.merge, out, args.jobs, args.codes, args.issued)
+        except (OSError, ValueError) as e:
+            parser.error(f'--merge: {e}')
+        return
+    build(args.formats, args.out_dir, args.jobs)
 
 
 if __name__ == '__main__':
-    build()
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Oja POS asset tooling — one entry point for the icon, docs and bench scripts
+
+Run:  python3 oja-tools.py icons [targets...] [--pyramid ...]   # generate-icons.py
+      python3 oja-tools.py docs [--format md ...]               # generate-oja-docs.py
+      python3 oja-tools.py bench icons|docs [--quick ...]        # bench-*.py
+      python3 oja-tools.py <command> --help                     # that tool's options
+
+Everything after the command goes to the tool unchanged. Tools are imported
+only when their command runs, so PIL and python-docx stay out of --help and
+of the other commands; this file itself needs nothing beyond the stdlib.
+"""
+
+import argparse
+import importlib
+import importlib.util
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# command: (module name, script, summary)
+TOOLS = {
+    'icons': ('generate_icons', 'generate-icons.py', 'app icons, splash screens and web manifest (PIL)'),
+    'docs': ('generate_oja_docs', 'generate-oja-docs.py', 'setup & reference guide as .docx, Markdown, HTML'),
+}
+BENCHES = {
+    'icons': ('bench_icons', 'bench-icons.py', 'icon generation timings and memory vs the baseline'),
+    'docs': ('bench_docs', 'bench-docs.py', 'guide and synthetic document timings vs the baseline'),
+}
+SCRIPTS = {module: script for module, script, _ in [*TOOLS.values(), *BENCHES.values()]}
+
+
+class ScriptFinder:
+    """Makes the hyphenated scripts importable by module name.
+
+    Process pools pickle functions by module + name, so a worker has to be
+    able to import generate_icons too — installing the finder at import time
+    covers workers started with spawn, which re-import this file.
+    """
+
+    def find_spec(self, name, path=None, target=None):
+        script = SCRIPTS.get(name)
+        if script is None:
+            return None
+        return importlib.util.spec_from_file_location(name, os.path.join(HERE, script))
+
+
+if not any(isinstance(finder, ScriptFinder) for finder in sys.meta_path):
+    sys.meta_path.append(ScriptFinder())
+
+
+def commands():
+    """The command list for --help"""
+    width = max(len(name) for name in [*TOOLS, *BENCHES]) + len('bench ')
+    lines = [f'  {name:<{width}}  {summary}' for name, (_, _, summary) in TOOLS.items()]
+    lines += [f'  {"bench " + name:<{width}}  {summary}' for name, (_, _, summary) in BENCHES.items()]
+    return 'commands:\n' + '\n'.join(lines)
+
+
+def run(command, module_name, argv):
+    """Import the tool and hand it argv, with its usage lines showing this command"""
+    module = importlib.import_module(module_name)
+    prog, sys.argv[0] = sys.argv[0], f'oja-tools.py {command}'
+    try:
+        return module.main(argv)
+    finally:
+        sys.argv[0] = prog
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='oja-tools.py', description='Oja POS asset tooling',
+                                     epilog=commands(), formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', nargs='?', choices=[*TOOLS, 'bench'], metavar='command')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='passed to the tool (<command> --help lists them)')
+    args = parser.parse_args(argv)
+
+    if args.command in TOOLS:
+        return run(args.command, TOOLS[args.command][0], args.args)
+    if args.command == 'bench' and args.args and args.args[0] in BENCHES:
+        name = args.args[0]
+        return run(f'bench {name}', BENCHES[name][0], args.args[1:])
+    if args.command == 'bench' and args.args and args.args[0] not in ('-h', '--help'):
+        parser.error(f'unknown bench {args.args[0]!r} (choose from {", ".join(BENCHES)})')
+    parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,35 +1,81 @@
 const CACHE_NAME = 'oja-pos-v2';
 const STATIC_CACHE = 'oja-static-v2';
 const DYNAMIC_CACHE = 'oja-dynamic-v2';
+// Revisioned assets live in their own unversioned cache: each entry is keyed
+// by its revision, so a deploy only re-downloads the files that changed.
+const PRECACHE = 'oja-precache';
 
 // App shell files to cache on install
 const APP_SHELL = [
   '/',
   '/manifest.json',
-  '/icon-192.png',
-  '/icon-512.png',
 ];
 
-// Install: cache app shell
+// precache:start — generated by generate-icons.py --web-manifest, do not edit
+const PRECACHE_MANIFEST = [
+  { url: '/icon-192.png', revision: '73d77f1ffc9449e5' },
+  { url: '/icon-192.webp', revision: '1a0746b436820217' },
+  { url: '/icon-512.png', revision: '192994a4dfde888d' },
+  { url: '/icon-512.webp', revision: 'da9a5b1e172b27e8' },
+  { url: '/icon.svg', revision: '37951d64378c66b8' },
+];
+// precache:end
+
+const precacheKey = (entry) => `${entry.url}?__rev=${entry.revision}`;
+
+const precacheEntryFor = (url) =>
+  url.origin === self.location.origin &&
+  PRECACHE_MANIFEST.find((entry) => entry.url === url.pathname);
+
+// Install: cache app shell + any precache entries whose revision we don't have
 self.addEventListener('install', (event) => {
   event.waitUntil(
-    caches.open(STATIC_CACHE).then((cache) => {
-      return cache.addAll(APP_SHELL);
-    })
+    Promise.all([
+      caches.open(STATIC_CACHE).then((cache) => {
+        return cache.addAll(APP_SHELL);
+      }),
+      caches.open(PRECACHE).then((cache) => {
+        return Promise.all(
+          PRECACHE_MANIFEST.map((entry) => {
+            const key = precacheKey(entry);
+            return cache.match(key).then((cached) => {
+              if (cached) return;
+              return fetch(entry.url, { cache: 'no-cache' }).then((response) => {
+                if (response.ok) return cache.put(key, response);
+              });
+            });
+          })
+        );
+      }),
+    ])
   );
   self.skipWaiting();
 });
 
-// Activate: clean old caches
+// Activate: clean old caches and precache revisions no longer listed
 self.addEventListener('activate', (event) => {
+  const current = new Set(
+    PRECACHE_MANIFEST.map((entry) => new URL(precacheKey(entry), self.location).href)
+  );
   event.waitUntil(
-    caches.keys().then((keys) => {
-      return Promise.all(
-        keys
-          .filter((key) => key !== STATIC_CACHE && key !== DYNAMIC_CACHE)
-          .map((key) => caches.delete(key))
-      );
-    })
+    Promise.all([
+      caches.keys().then((keys) => {
+        return Promise.all(
+          keys
+            .filter((key) => key !== STATIC_CACHE && key !== DYNAMIC_CACHE && key !== PRECACHE)
+            .map((key) => caches.delete(key))
+        );
+      }),
+      caches.open(PRECACHE).then((cache) => {
+        return cache.keys().then((requests) => {
+          return Promise.all(
+            requests
+              .filter((request) => !current.has(request.url))
+              .map((request) => cache.delete(request))
+          );
+        });
+      }),
+    ])
   );
   self.clients.claim();
 });
@@ -78,9 +124,20 @@ self.addEventListener('fetch', (event) => {
     return;
   }
 
+  // Precached assets: serve the current revision, fall back to the network
+  const entry = precacheEntryFor(url);
+  if (entry) {
+    event.respondWith(
+      caches.open(PRECACHE).then((cache) => {
+        return cache.match(precacheKey(entry)).then((cached) => cached || fetch(request));
+      })
+    );
+    return;
+  }
+
   // Static assets (JS, CSS, images, fonts): cache-first
   if (
-    url.pathname.match(/\.(js|css|png|jpg|jpeg|svg|gif|woff|woff2|ttf|eot|ico)$/) ||
+    url.pathname.match(/\.(js|css|png|jpg|jpeg|webp|svg|gif|woff|woff2|ttf|eot|ico)$/) ||
     url.pathname.startsWith('/_next/') ||
     url.pathname.startsWith('/static/')
   ) {
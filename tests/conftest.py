@@ -0,0 +1,27 @@
+"""The generator scripts, loaded as modules — their file names have dashes,
+so they can't be imported by name"""
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_script(filename, name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module      # process-pool workers pickle functions by module name
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='session')
+def gi():
+    return load_script('generate-icons.py', 'generate_icons')
+
+
+@pytest.fixture(scope='session')
+def gd():
+    return load_script('generate-oja-docs.py', 'generate_oja_docs')
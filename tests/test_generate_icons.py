@@ -0,0 +1,140 @@
+import pytest
+
+
+def untiled(gi, monkeypatch, render, *args):
+    monkeypatch.setattr(gi, 'SS_TILE_PIXELS', 1 << 40)
+    img = render(*args)
+    monkeypatch.undo()
+    return img
+
+
+@pytest.mark.parametrize('size, samples', [(1024, 4), (700, 8), (180, 3), (48, 2)])
+def test_tiled_render_matches_untiled(gi, monkeypatch, size, samples):
+    monkeypatch.setattr(gi, 'SS_TILE_PIXELS', 64 * 1024)      # many seams, even at 48px
+    tiled = gi.render_icon(size, samples)
+    assert tiled.tobytes() == untiled(gi, monkeypatch, gi.render_icon, size, samples).tobytes()
+
+
+def test_tiled_rounded_rect_matches_untiled(gi, monkeypatch):
+    def render():
+        return gi.render_supersampled(300, 300, (0, 0, 0, 0),
+                                      lambda d: gi.draw_rounded_rect(d, (20, 30, 270, 255), 41, gi.ORANGE), 4)
+
+    monkeypatch.setattr(gi, 'SS_TILE_PIXELS', 32 * 1024)
+    tiled = render()
+    assert tiled.tobytes() == untiled(gi, monkeypatch, render).tobytes()
+
+
+# ── render service ───────────────────────────────────────────────────────────
+
+@pytest.fixture
+def server(gi):
+    import threading
+    server = gi.make_server(0, cache_bytes=4 * 1024 * 1024)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def request(server, path, method='GET', **headers):
+    import http.client
+    conn = http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=30)
+    try:
+        conn.request(method, path, headers=headers)
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        conn.close()
+
+
+ICON = '/render?kind=icon&size=64'
+
+
+def test_render_revalidates_by_etag(server):
+    status, headers, body = request(server, ICON)
+    assert status == 200 and body.startswith(b'\x89PNG')
+    etag = headers['ETag']
+    for tag in (etag, f'W/{etag}', '*', f'"other", {etag}'):
+        status, headers, body = request(server, ICON, **{'If-None-Match': tag})
+        assert (status, headers['ETag'], body) == (304, etag, b''), tag
+    assert request(server, ICON, **{'If-None-Match': '"other"'})[0] == 200
+    stats = server.service.stats()
+    assert stats['cache']['misses'] == 1 and stats['latency']['not_modified']['count'] == 4
+
+
+def test_head_matches_get_without_body(server):
+    _, get_headers, body = request(server, ICON)
+    status, headers, head_body = request(server, ICON, 'HEAD')
+    assert (status, head_body) == (200, b'')
+    assert headers['Content-Length'] == str(len(body)) and headers['ETag'] == get_headers['ETag']
+    assert request(server, '/stats', 'HEAD')[::2] == (200, b'')
+
+
+@pytest.mark.parametrize('query', ['size=64&size=512', 'kind=icon&kind=splash', 'size=64x', 'size=+64',
+                                   'size=8', 'kind=logo', 'colour=red'])
+def test_render_rejects_bad_queries(server, query):
+    status, headers, body = request(server, f'/render?{query}')
+    assert status == 400 and headers['Content-Type'] == 'application/json'
+    assert b'"error"' in body
+
+
+def test_render_cache_key_follows_the_palette(gi, monkeypatch):
+    target = gi.serve_request({'kind': 'icon', 'size': '64'})[0]
+    before = gi.target_fingerprint(target)
+    monkeypatch.setattr(gi, 'ORANGE', (0, 128, 255))
+    assert gi.target_fingerprint(target) != before
+
+
+# ── build ────────────────────────────────────────────────────────────────────
+
+SMALL_TARGETS = ('favicon', 'pwa-192', 'apple-touch-icon', 'icon-svg')
+
+
+def build_into(gi, monkeypatch, directory, **options):
+    """Build the small targets with directory as the working directory —
+    outputs and the build cache land there, not in the repo"""
+    directory.mkdir(exist_ok=True)
+    monkeypatch.chdir(directory)
+    targets = [t for t in gi.TARGETS if t.name in SMALL_TARGETS]
+    assert gi.build(targets, **options) == []
+    return {path: (directory / path).read_bytes() for t in targets for path in gi.output_paths(t)}
+
+
+def test_pooled_build_matches_serial(gi, monkeypatch, tmp_path):
+    serial = build_into(gi, monkeypatch, tmp_path / 'serial', jobs=1)
+    assert build_into(gi, monkeypatch, tmp_path / 'pooled', jobs=2) == serial
+
+
+def test_build_cache_skips_fresh_targets(gi, monkeypatch, tmp_path, capsys):
+    first = build_into(gi, monkeypatch, tmp_path, jobs=1)
+    capsys.readouterr()
+    assert build_into(gi, monkeypatch, tmp_path, jobs=1) == first
+    assert '0/4 targets rebuilt' in capsys.readouterr().out
+
+    (tmp_path / 'public' / 'icon-192.png').write_bytes(b'edited')     # changed outside the build
+    assert build_into(gi, monkeypatch, tmp_path, jobs=1) == first
+    assert '1/4 targets rebuilt' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('name, value', [
+    ('ORANGE', (0, 128, 255)),
+    ('MASTER_SIZE', 1024),
+    ('MIN_PSNR', 40.0),
+    ('ZLIB_LEVELS', (9,)),
+])
+def test_input_key_covers_settings(gi, monkeypatch, name, value):
+    target = gi.TARGETS[0]
+    before = gi.input_key(target)
+    monkeypatch.setattr(gi, name, value)
+    assert gi.input_key(target) != before
+
+
+def test_input_key_covers_emblem_proportions_and_target(gi, monkeypatch):
+    target = gi.TARGETS[0]
+    before = gi.input_key(target)
+    assert gi.input_key(target._replace(samples=3)) != before
+    assert gi.input_key(target, pyramid=True) != before
+    monkeypatch.setitem(gi.EMBLEMS, 'icon', (gi.DARK_BG, 0.4, 0.42))
+    assert gi.input_key(target) != before
@@ -0,0 +1,208 @@
+import io
+import json
+import re
+
+import pytest
+
+
+@pytest.fixture(scope='session')
+def sections(gd, tmp_path_factory):
+    sources = gd.SourceCache(str(tmp_path_factory.mktemp('sources') / 'sources.json'))
+    return gd.guide_content(sources)
+
+
+def edited(gd, sections, index):
+    """sections with one extra paragraph at the end of sections[index]"""
+    section = sections[index]
+    changed = section._replace(nodes=section.nodes + [gd.Paragraph('An extra paragraph.')])
+    return sections[:index] + [changed] + sections[index + 1:]
+
+
+# ── DOCX fragment cache ──────────────────────────────────────────────────────
+
+def test_warm_docx_matches_cold(gd, sections, tmp_path):
+    cold = gd.render_docx(sections, str(tmp_path))
+    warm = gd.render_docx(sections, str(tmp_path))
+    assert gd.render_notes['docx'] == f'0/{len(sections)} sections rebuilt'
+    assert warm == cold
+
+
+def test_edited_section_rebuilds_alone(gd, sections, tmp_path):
+    gd.render_docx(sections, str(tmp_path / 'warm'))
+    changed = edited(gd, sections, 2)
+    warm = gd.render_docx(changed, str(tmp_path / 'warm'))
+    assert gd.render_notes['docx'] == f'1/{len(sections)} sections rebuilt'
+    assert warm == gd.render_docx(changed, str(tmp_path / 'cold'))
+
+
+@pytest.mark.parametrize('name, value', [
+    ('ROLE_STYLES', {'body': 'Oja Note'}),
+    ('TABLE_CHUNK_ROWS', 7),
+    ('TABLE_STYLE', 'Table Grid'),
+])
+def test_shared_digest_covers_renderer_tables(gd, monkeypatch, name, value):
+    before = gd.docx_shared_digest(gd.new_document())
+    if isinstance(value, dict):
+        value = {**getattr(gd, name), **value}
+    monkeypatch.setattr(gd, name, value)
+    assert gd.docx_shared_digest(gd.new_document()) != before
+
+
+# ── mail merge ───────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def codes(gd, tmp_path):
+    sources = gd.SourceCache(str(tmp_path / 'sources.json'))
+    return [code for rel in gd.repo_files(gd.CODE_FILES) for code in sources.parse(gd.parse_codes, rel)]
+
+
+def records(gd, tmp_path, text, issued=None):
+    path = tmp_path / 'shops.csv'
+    path.write_text(text, encoding='utf-8')
+    return gd.merge_records(str(path), gd.SourceCache(str(tmp_path / 'sources.json')), issued=issued)
+
+
+def test_merge_hands_out_codes_in_file_order(gd, tmp_path, codes):
+    got = records(gd, tmp_path, f'shop,code\nA,\nB,{codes[0]}\nC,\n')
+    assert [(r['shop'], r['code']) for r in got] == [('A', codes[1]), ('B', codes[0]), ('C', codes[2])]
+
+
+def test_merge_skips_issued_codes(gd, tmp_path, codes):
+    ledger = str(tmp_path / 'issued.csv')
+    assert gd.record_issued(records(gd, tmp_path, 'shop\nA\n', gd.load_issued(ledger)), ledger) == 1
+    second = records(gd, tmp_path, 'shop\nMama Put\n', gd.load_issued(ledger))
+    assert second[0]['code'] == codes[1]
+    assert gd.record_issued(second, ledger) == 1
+    assert gd.load_issued(ledger) == {codes[0]: 'A', codes[1]: 'Mama Put'}
+
+
+def test_merge_allows_a_reprint_for_the_same_shop(gd, tmp_path, codes):
+    got = records(gd, tmp_path, f'shop,code\nA,{codes[0]}\n', {codes[0]: 'A'})
+    assert got[0]['code'] == codes[0]
+
+
+@pytest.mark.parametrize('text, error', [
+    ('name\nA\n', 'expected a CSV with a "shop" column'),
+    ('shop\n', 'expected a CSV with a "shop" column'),
+    ('code,shop\nA,\n', ':2: no shop name'),
+    ('code,shop\nOJA-ZZZZ-ZZZZ\n', ':2: no shop name'),
+    ('shop,contact\n  ,x\n', ':2: no shop name'),
+    ('shop\nA\n"B",extra\n', ':3: more fields than the header'),
+    ('shop,code\nA,OJA-ZZZZ-ZZZZ\n', ':2: OJA-ZZZZ-ZZZZ is not in'),
+    ('shop,code\nA,{0}\nB,{0}\n', ':3: {0} is used twice'),
+    ('shop,code\nB,{0}\n', ":2: {0} was already issued to 'A'"),
+])
+def test_merge_rejects_bad_rows(gd, tmp_path, codes, text, error):
+    with pytest.raises(ValueError, match=re.escape(error.format(codes[0]))):
+        records(gd, tmp_path, text.format(codes[0]), {codes[0]: 'A'})
+
+
+def test_merge_needs_enough_codes(gd, tmp_path, codes):
+    with pytest.raises(ValueError, match=f'{len(codes) + 1} shops but only {len(codes)} unissued'):
+        records(gd, tmp_path, 'shop\n' + ''.join(f'S{i}\n' for i in range(len(codes) + 1)))
+
+
+def test_stamped_sheet_escapes_fields(gd):
+    import zipfile
+    from lxml import etree
+    gd.merge_init(gd.merge_template(gd.setup_sheet_content()))
+    record = {'shop': 'Mama & Sons <Ikeja>', 'code': 'OJA-AZAV-FDKW', 'tier': 'Business',
+              'days': '30', 'contact': '"quoted" \'x\''}
+    with zipfile.ZipFile(io.BytesIO(gd.stamp_sheet(record))) as z:
+        xml = z.read('word/document.xml')
+    text = ''.join(etree.fromstring(xml).itertext())
+    assert 'Setup Sheet for Mama & Sons <Ikeja>' in text
+    assert '"quoted" \'x\'' in text
+    assert b'{{' not in xml
+
+
+# ── bulk tables ──────────────────────────────────────────────────────────────
+
+CELLS = ['plain', ' leading', 'trailing ', 'tab\there', 'two\nlines', '', '& < > "', 'Adé ₦1,500', 42]
+
+
+def runs(cell):
+    """A cell's run XML, minus the empty run python-docx leaves for ''"""
+    from docx.oxml.ns import qn
+    from lxml import etree
+    return [etree.tostring(run) for run in cell._tc.iter(qn('w:r')) if len(run)]
+
+
+def test_bulk_table_matches_python_docx_cells(gd):
+    from docx.shared import Inches
+    doc = gd.new_document()
+    headers, widths = ['Name', 'Notes', 'Price'], [1.0, 2.5, 1.25]
+    rows = [CELLS[i:i + 3] for i in range(0, len(CELLS), 3)]
+    table = gd.docx_table(doc, headers, rows, widths)
+    reference = doc.add_table(rows=1 + len(rows), cols=len(headers))
+    for r, values in enumerate([headers] + rows):
+        for c, value in enumerate(values):
+            expected = reference.cell(r, c)
+            expected.text = str(value)
+            cell = table.cell(r, c)
+            assert (cell.text, runs(cell)) == (expected.text, runs(expected)), (r, c)
+            assert cell.width == Inches(widths[c])
+    assert table.rows[0]._tr.trPr is not None       # header row repeats on each page
+
+
+def test_bulk_table_chunks_keep_row_order(gd, monkeypatch):
+    monkeypatch.setattr(gd, 'TABLE_CHUNK_ROWS', 3)
+    rows = [[f'item {i}', str(i)] for i in range(10)]
+    table = gd.docx_table(gd.new_document(), ['Item', 'Qty'], rows)
+    assert [[cell.text for cell in row.cells] for row in table.rows] == [['Item', 'Qty']] + rows
+
+
+# ── search index ─────────────────────────────────────────────────────────────
+
+def decode_postings(index):
+    """{term: [(entry, weight)]} from the packed, gap-encoded postings"""
+    bits = index['weight_bits']
+    postings = {}
+    for term, packed in index['terms'].items():
+        entry, decoded = 0, []
+        for value in packed:
+            entry += value >> bits
+            decoded.append((entry, value & ((1 << bits) - 1)))
+        postings[term] = decoded
+    return postings
+
+
+def test_search_index_round_trip(gd, sections, tmp_path):
+    index = json.loads(gd.render_search_index(sections, str(tmp_path)))
+    expected, places, entry = {}, [], 0
+    for number, section in enumerate(sections):
+        for anchor, text, boost in gd.index_entries(section):
+            counts = {}
+            for term in gd.index_terms(text):
+                counts[term] = counts.get(term, 0) + boost
+            if not counts:
+                continue
+            for term, weight in counts.items():
+                expected.setdefault(term, []).append((entry, min(weight, gd.WEIGHT_MAX)))
+            places.append([number, anchor])
+            entry += 1
+    assert decode_postings(index) == expected
+    assert list(index['terms']) == sorted(expected)
+    assert [index['anchors'][anchor] for anchor, _ in index['entries']] == places
+    assert len(index['sections']) == len(sections)
+
+
+def test_warm_search_index_matches_cold(gd, sections, tmp_path):
+    cold = gd.render_search_index(sections, str(tmp_path))
+    assert gd.render_search_index(sections, str(tmp_path)) == cold
+    assert gd.render_notes['index'].endswith(f' 0/{len(sections)} sections rebuilt')
+    changed = edited(gd, sections, 3)
+    warm = gd.render_search_index(changed, str(tmp_path))
+    assert gd.render_notes['index'].endswith(f' 1/{len(sections)} sections rebuilt')
+    assert warm == gd.render_search_index(changed, str(tmp_path / 'cold'))
+
+
+# ── renderers ────────────────────────────────────────────────────────────────
+
+def test_pooled_build_matches_in_process(gd, tmp_path):
+    serial = gd.build(out_dir=str(tmp_path / 'serial'), jobs=1)
+    pooled = gd.build(out_dir=str(tmp_path / 'pooled'))
+    assert set(serial) == set(pooled) == set(gd.RENDERERS)
+    for fmt in gd.RENDERERS:
+        with open(serial[fmt], 'rb') as a, open(pooled[fmt], 'rb') as b:
+            assert a.read() == b.read(), fmt